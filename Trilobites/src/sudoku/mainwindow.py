@@ -1,40 +1,40 @@
 #!/usr/bin/env python
 # -*- coding : utf-8 -*-
 
-from PyQt5.QtWidgets import QApplication, QWidget, QMessageBox, QLabel, QPushButton
-from PyQt5.QtCore import QEvent, QTimer
+import time
+
+from PyQt5.QtWidgets import QApplication, QWidget, QMessageBox, QShortcut
+from PyQt5.QtGui import QKeySequence
+from PyQt5.QtCore import QTimer
 
 from sudokuui import Ui_sudokuMainWindow
 from sudoku import Sudoku, SudokuLevel
+from puzzlepool import PuzzlePool
+from solveworker import SolveWorker
+from sudokuhistory import Move, MoveHistory, parseMove
+from sudokusession import SessionStore
 
 
 class SudokuWindow(QWidget, Ui_sudokuMainWindow):
+    solveTimeout = 10.0
+
+    gameLevels = {
+        "初级" : SudokuLevel.P,
+        "中级" : SudokuLevel.M,
+        "高级" : SudokuLevel.H,
+        "特级" : SudokuLevel.S,
+        "超级" : SudokuLevel.T
+    }
+
+    # the number buttons share one static stylesheet keyed by a dynamic
+    # "state" property, so changing a state never re-parses styles
+    buttonStyle = 'QPushButton[state="n"] {background-color: rgb(240, 240, 240);}\n' \
+                  'QPushButton[state="f"] {background-color: rgb(255, 255, 220);}'
 
     def __init__(self, parent=None):
         super(SudokuWindow, self).__init__(parent)
         self.setupUi(self)
 
-        self._labels = [
-            [self.label1_1, self.label1_2, self.label1_3, self.label1_4, self.label1_5,
-             self.label1_6, self.label1_7, self.label1_8, self.label1_9],
-            [self.label2_1, self.label2_2, self.label2_3, self.label2_4, self.label2_5,
-             self.label2_6, self.label2_7, self.label2_8, self.label2_9],
-            [self.label3_1, self.label3_2, self.label3_3, self.label3_4, self.label3_5,
-             self.label3_6, self.label3_7, self.label3_8, self.label3_9],
-            [self.label4_1, self.label4_2, self.label4_3, self.label4_4, self.label4_5,
-             self.label4_6, self.label4_7, self.label4_8, self.label4_9],
-            [self.label5_1, self.label5_2, self.label5_3, self.label5_4, self.label5_5,
-             self.label5_6, self.label5_7, self.label5_8, self.label5_9],
-            [self.label6_1, self.label6_2, self.label6_3, self.label6_4, self.label6_5,
-             self.label6_6, self.label6_7, self.label6_8, self.label6_9],
-            [self.label7_1, self.label7_2, self.label7_3, self.label7_4, self.label7_5,
-             self.label7_6, self.label7_7, self.label7_8, self.label7_9],
-            [self.label8_1, self.label8_2, self.label8_3, self.label8_4, self.label8_5,
-             self.label8_6, self.label8_7, self.label8_8, self.label8_9],
-            [self.label9_1, self.label9_2, self.label9_3, self.label9_4, self.label9_5,
-             self.label9_6, self.label9_7, self.label9_8, self.label9_9],
-        ]
-
         self._buttons = [None, self.numberButton1, self.numberButton2, self.numberButton3,
                                self.numberButton4, self.numberButton5, self.numberButton6,
                                self.numberButton7, self.numberButton8, self.numberButton9]
@@ -45,12 +45,17 @@ class SudokuWindow(QWidget, Ui_sudokuMainWindow):
 
         self.initTimer()
 
-        self._operationList = []
+        self._history = MoveHistory(self._originSudoku[:, :], self._originSudoku.notes)
+        self._conflicted = set()
+        self._puzzlePool = PuzzlePool(parent=self)
+        self._solveWorker = None
+        self._solveBoard = None
+        self._sessions = SessionStore(parent=self)
+        self._sessionName = None
 
-        for i in range(Sudoku.rows):
-            for j in range(Sudoku.cols):
-                self._labels[i][j].installEventFilter(self)
+        self.sudokuBoard.cellClicked.connect(self.cellClicked)
 
+        self.groupBox.setStyleSheet(SudokuWindow.buttonStyle)
         for i in range(1, 10):
             self._buttons[i].clicked.connect(self.selectCurrentNumber)
             self.setWidgetBackgroundColor(self._buttons[i])
@@ -58,6 +63,17 @@ class SudokuWindow(QWidget, Ui_sudokuMainWindow):
         self.newGameButton.clicked.connect(self.startNewGame)
         self.restartButton.clicked.connect(self.restartGame)
         self.rollbackButton.clicked.connect(self.rollbackGame)
+        self.redoButton.clicked.connect(self.redoGame)
+        QShortcut(QKeySequence.Undo, self, self.rollbackGame)
+        QShortcut(QKeySequence.Redo, self, self.redoGame)
+        self.solveButton.clicked.connect(self.solveGame)
+
+        self._sessions.sessionsChanged.connect(self.updateSavedGames)
+        self.savedGamesComboBox.activated[int].connect(self.selectSavedGame)
+        self.updateSavedGames()
+        for name, _ in self._sessions.sessions():
+            if self.resumeSession(name):
+                break
 
     def initTimer(self):
         self._timeCounter = -1
@@ -83,63 +99,56 @@ class SudokuWindow(QWidget, Ui_sudokuMainWindow):
         else:
             self._currentNumber = 0
 
-    def eventFilter(self, obj, event):
-        if event.type() == QEvent.MouseButtonPress:
-            if self._currentNumber != 0:
-                x, y = self.findMouseClickPos(obj)
-                if x != -1 and y != -1:
-                    self._currentSudoku[x, y] = self._currentNumber
-                    self._operationList.append((x, y, self._currentNumber))
-
-                    obj.setText(str(self._currentNumber))
-                    self.setWidgetBackgroundColor(obj, 'f')
+    def cellClicked(self, x, y):
+        # clues are fixed, neither their digit nor notes can be changed
+        if self._currentNumber == 0 or self._originSudoku[x, y] != 0:
+            return
 
-                    if pos := self._currentSudoku.findConflictedPos(x, y):
-                        pass
+        if self.notesButton.isChecked():
+            self.toggleNote(x, y, self._currentNumber)
+            self.saveSession()
+            return
 
-                    if self._currentSudoku.isSolved():
-                        QMessageBox.information(self, '祝贺！', "成功解决当前sudoku！", QMessageBox.Close, QMessageBox.Close)
+        if not self.playMove(x, y, self._currentNumber):
+            return
 
-            return True
+        self.updateConflicts(((x, y),))
 
-        return False
+        if self._currentSudoku.isSolved():
+            self.finishSession()
+            QMessageBox.information(self, '祝贺！', "成功解决当前sudoku！", QMessageBox.Close, QMessageBox.Close)
+        else:
+            self.saveSession()
 
-    def findMouseClickPos(self, obj):
-        for i in range(Sudoku.rows):
-            for j in range(Sudoku.cols):
-                if self._labels[i][j] == obj:
-                    return i, j
-        return -1, -1
+    def closeEvent(self, event):
+        self.cancelSolve()
+        self.saveSession()
+        self._sessions.close()
+        self._puzzlePool.shutdown()
+        super(SudokuWindow, self).closeEvent(event)
 
     def initGame(self):
+        self.cancelSolve()
         self._currentSudoku = self._originSudoku.copy()
-        self._operationList = []
+        self._history.reset(self._originSudoku[:, :], self._originSudoku.notes)
 
     def getGameLevel(self):
-        levels = {
-            "初级" : SudokuLevel.P,
-            "中级" : SudokuLevel.M,
-            "高级" : SudokuLevel.H,
-            "特级" : SudokuLevel.S,
-            "超级" : SudokuLevel.T
-        }
-
-        return levels.setdefault(self.gameLevelComboBox.currentText(), SudokuLevel.P)
+        return SudokuWindow.gameLevels.get(self.gameLevelComboBox.currentText(), SudokuLevel.P)
 
     def startNewGame(self):
         # self._originSudoku = Sudoku.buildSudoku()
-        self._originSudoku = Sudoku.generateSudoku(self.getGameLevel())
+        self.saveSession()
+        self._sessions.flush()
+        self._originSudoku = self._puzzlePool.pop(self.getGameLevel())
         self.initGame()
 
         self.updateSudokuWindow(self._originSudoku)
         self.resetTimer()
         self.updateTimeCounter()
+        self.clearCurrentNumber()
 
-        if self._currentNumber != 0:
-            self._buttons[self._currentNumber].setChecked(False)
-            self._buttons[self._currentNumber].setChecked(False)
-            self.setWidgetBackgroundColor(self._buttons[self._currentNumber])
-            self._currentNumber = 0
+        self._sessionName = self._sessions.newName()
+        self.saveSession()
 
     def restartGame(self):
         self.initGame()
@@ -148,20 +157,210 @@ class SudokuWindow(QWidget, Ui_sudokuMainWindow):
         self._timer.start(1000)
         self._timeCounter = -1
         self.updateTimeCounter()
+        self.clearCurrentNumber()
+        self.saveSession()
 
+    def clearCurrentNumber(self):
         if self._currentNumber != 0:
-            self._buttons[self._currentNumber].setChecked(False)
             self._buttons[self._currentNumber].setChecked(False)
             self.setWidgetBackgroundColor(self._buttons[self._currentNumber])
             self._currentNumber = 0
 
+    def sessionState(self):
+        moves = [[move.x, move.y, move.before, move.after, [list(mark) for mark in move.marks]]
+                 for move in self._history.moves]
+        return {
+            "origin" : repr(self._originSudoku),
+            "moves" : moves,
+            "cursor" : self._history.cursor,
+            "time" : max(self._timeCounter, 0),
+        }
+
+    def saveSession(self):
+        # only arms the store's debounce timer, the state is built when it fires
+        if self._sessionName is not None:
+            self._sessions.save(self._sessionName, self.sessionState)
+
+    def finishSession(self):
+        if self._sessionName is not None:
+            self._sessions.remove(self._sessionName)
+            self._sessionName = None
+
+    def resumeSession(self, name):
+        state = self._sessions.state(name)
+        # a damaged session file is dropped instead of breaking startup
+        try:
+            origin = Sudoku(state["origin"])
+            if origin.rows != Sudoku.rows:
+                raise ValueError(f"not a {Sudoku.rows}x{Sudoku.cols} board")
+            moves = [parseMove(move, origin.rows) for move in state["moves"]]
+            cursor = min(max(int(state["cursor"]), 0), len(moves))
+            timeCounter = max(int(state["time"]), 0)
+        except (KeyError, IndexError, TypeError, ValueError):
+            self._sessions.remove(name)
+            return False
+
+        # the current game is saved before it is replaced
+        self.saveSession()
+        self._sessions.flush()
+        self._originSudoku = origin
+        self.initGame()
+        self.updateSudokuWindow(self._originSudoku)
+        self._history.restore(moves)
+        self.jumpToMove(cursor)
+        self._sessionName = name
+
+        self._timer.stop()
+        self._timer.start(1000)
+        self._timeCounter = timeCounter - 1
+        self.updateTimeCounter()
+        self.clearCurrentNumber()
+        self.updateSavedGames()
+        return True
+
+    def updateSavedGames(self):
+        names = {level : name for name, level in SudokuWindow.gameLevels.items()}
+        self.savedGamesComboBox.clear()
+        for name, state in self._sessions.sessions():
+            level = self._originSudoku.parseSudokuLevel(str(state.get("origin", "")).split(", ", 1)[0])
+            saved = time.strftime("%m-%d %H:%M", time.localtime(state.get("saved", 0)))
+            self.savedGamesComboBox.addItem(f"{saved} {names[level]}", name)
+        self.savedGamesComboBox.setCurrentIndex(self.savedGamesComboBox.findData(self._sessionName))
+
+    def selectSavedGame(self, index):
+        name = self.savedGamesComboBox.itemData(index)
+        if name is not None and name != self._sessionName:
+            self.resumeSession(name)
+
+    def playMove(self, x, y, number):
+        before = int(self._currentSudoku[x, y])
+        if before == number:
+            return False
+
+        self.setCellValue(x, y, number)
+        marks = tuple(self._currentSudoku.pruneNotes(x, y, number)) if number != 0 else ()
+        self.setMarks(marks)
+        self._history.push(Move(x, y, before, number, marks), self._currentSudoku[:, :], self._currentSudoku.notes)
+        return True
+
+    def toggleNote(self, x, y, number):
+        value = int(self._currentSudoku[x, y])
+        if value != 0:
+            return
+
+        before = int(self._currentSudoku.notes[x, y])
+        after = self._currentSudoku.toggleNote(x, y, number)
+        self.sudokuBoard.setNotes(x, y, after)
+        self._history.push(Move(x, y, value, value, ((x, y, before, after),)),
+                           self._currentSudoku[:, :], self._currentSudoku.notes)
+
+    def setMarks(self, marks, undo=False):
+        notes = self._currentSudoku.notes
+        for x, y, before, after in marks:
+            notes[x, y] = before if undo else after
+            self.sudokuBoard.setNotes(x, y, notes[x, y])
+
     def rollbackGame(self):
-        if len(self._operationList) == 0:
+        move = self._history.undo()
+        if move is None:
+            return
+
+        self.setCellValue(move.x, move.y, move.before)
+        self.setMarks(move.marks, undo=True)
+        self.updateConflicts(((move.x, move.y),))
+        self.saveSession()
+
+    def redoGame(self):
+        move = self._history.redo()
+        if move is None:
+            return
+
+        self.setCellValue(move.x, move.y, move.after)
+        self.setMarks(move.marks)
+        self.updateConflicts(((move.x, move.y),))
+        self.saveSession()
+
+    def jumpToMove(self, index):
+        # rebuilds the position from the nearest snapshot instead of undoing
+        # or redoing the moves one by one
+        board, notes = self._history.jump(index)
+        self._currentSudoku[:, :] = board
+        self._currentSudoku.notes[:, :] = notes
+        self.refreshCells()
+
+    def setCellValue(self, x, y, value):
+        self._currentSudoku[x, y] = value
+        self.sudokuBoard.setCell(x, y, value, self.cellColor(x, y))
+
+    def refreshCells(self):
+        self._conflicted = self._currentSudoku.conflictedCells()
+        for x in range(Sudoku.rows):
+            for y in range(Sudoku.cols):
+                color = 'c' if (x, y) in self._conflicted else self.cellColor(x, y)
+                self.sudokuBoard.setCell(x, y, self._currentSudoku[x, y], color)
+                self.sudokuBoard.setNotes(x, y, self._currentSudoku.notes[x, y])
+
+    def cellColor(self, x, y):
+        if self._originSudoku[x, y] != 0:
+            return 'g'
+        return 'f' if self._currentSudoku[x, y] != 0 else 'n'
+
+    def updateConflicts(self, edited=()):
+        # recolors the cells entering or leaving a conflict, plus the edited
+        # cells, which setCellValue painted without knowing about conflicts
+        conflicted = self._currentSudoku.conflictedCells()
+        for x, y in (conflicted ^ self._conflicted).union(edited):
+            self.sudokuBoard.setCellColor(x, y, 'c' if (x, y) in conflicted else self.cellColor(x, y))
+
+        self._conflicted = conflicted
+
+    def solveGame(self):
+        if self._solveWorker is not None:
+            self.cancelSolve()
+            return
+
+        # the board stays editable while solving, a result for another
+        # position is dropped in solveFinished
+        self._solveBoard = self._currentSudoku[:, :].copy()
+        self._solveWorker = SolveWorker(self._currentSudoku, SudokuWindow.solveTimeout, self)
+        self._solveWorker.progress.connect(self.solveProgress)
+        self._solveWorker.solved.connect(self.solveFinished)
+        self._solveWorker.start()
+        self.solveButton.setText("取消")
+
+    def cancelSolve(self):
+        if self._solveWorker is None:
             return
 
-        x, y, num = self._operationList.pop()
-        self._currentSudoku[x, y] = 0
-        self._labels[x][y].setText(' ')
+        self._solveWorker.solved.disconnect(self.solveFinished)
+        self._solveWorker.requestInterruption()
+        self._solveWorker.wait()
+        self._solveWorker = None
+        self.solveButton.setText("求解")
+
+    def solveProgress(self, nodes):
+        self.solveButton.setText(f"取消 ({nodes})")
+
+    def solveFinished(self, status, result):
+        self._solveWorker.wait()
+        self._solveWorker = None
+        self.solveButton.setText("求解")
+
+        if status != SolveWorker.CANCELLED and (self._currentSudoku[:, :] != self._solveBoard).any():
+            QMessageBox.warning(self, '求解', "求解期间局面已改变，请重新求解！", QMessageBox.Close, QMessageBox.Close)
+        elif status == SolveWorker.SOLVED:
+            solution = Sudoku(result)
+            for x in range(Sudoku.rows):
+                for y in range(Sudoku.cols):
+                    if self._currentSudoku[x, y] == 0:
+                        self.playMove(x, y, int(solution[x, y]))
+            self.updateConflicts()
+            self._timer.stop()
+            self.finishSession()
+        elif status == SolveWorker.UNSOLVABLE:
+            QMessageBox.warning(self, '求解', "当前局面无解！", QMessageBox.Close, QMessageBox.Close)
+        elif status == SolveWorker.TIMEOUT:
+            QMessageBox.warning(self, '求解', "求解超时！", QMessageBox.Close, QMessageBox.Close)
 
     def updateTimeCounter(self):
         self._timeCounter += 1
@@ -174,30 +373,16 @@ class SudokuWindow(QWidget, Ui_sudokuMainWindow):
         self._timer.start(1000)
 
     def updateSudokuWindow(self, sudo):
-        for i in range(Sudoku.rows):
-            for j in range(Sudoku.cols):
-                if sudo[i, j] != 0:
-                    self._labels[i][j].setText(str(sudo[i, j]))
-                    self.setWidgetBackgroundColor(self._labels[i][j])
-                else:
-                    self._labels[i][j].setText(' ')
-                    self.setWidgetBackgroundColor(self._labels[i][j])
+        self._conflicted = set()
+        self.sudokuBoard.setNumbers(sudo[:, :])
 
     def setWidgetBackgroundColor(self, obj, color='n'):
-        color_styles = {
-            "f": "rgb(255, 255, 220);",
-            "n": "rgb(240, 240, 240);",
-        }
-
-        obj.setStyleSheet(obj.__class__.__name__ + "{background-color: " + color_styles[color] + "}")
-
-    def setWidgetColor(self, obj, color='n'):
-        color_styles = {
-            "f": "rgb(255, 0, 0);",
-            "n": "rgb(0, 0, 0);"
-        }
+        if obj.property("state") == color:
+            return
 
-        obj.setStyleSheet(obj.__class__.__name__ + "{color: " + color_styles[color] + "}")
+        obj.setProperty("state", color)
+        obj.style().unpolish(obj)
+        obj.style().polish(obj)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+# -*- coding : utf-8 -*-
+
+import os
+from collections import deque
+
+from PyQt5.QtCore import QCoreApplication, QEvent, QObject, QThread, pyqtSignal, pyqtSlot
+
+from sudoku import Sudoku, SudokuLevel
+
+
+class PuzzleWorker(QThread):
+    puzzleReady = pyqtSignal(str)
+
+    def __init__(self, demand, parent=None):
+        super(PuzzleWorker, self).__init__(parent)
+        self._demand = demand
+
+    def run(self):
+        for level, count in self._demand:
+            for _ in range(count):
+                if self.isInterruptionRequested():
+                    return
+                self.puzzleReady.emit(repr(Sudoku.generateSudoku(level)))
+
+
+class PuzzlePool(QObject):
+    lowWater = 2
+    highWater = 6
+
+    def __init__(self, path=None, parent=None):
+        super(PuzzlePool, self).__init__(parent)
+        self._path = path or os.path.join(os.path.expanduser("~"), ".sudoku", "puzzles.txt")
+        self._puzzles = {level : deque() for level in SudokuLevel}
+        self._worker = None
+        self._closing = False
+
+        self.load()
+        self.refill()
+
+    def load(self):
+        try:
+            with open(self._path, encoding="utf-8") as f:
+                for line in f:
+                    self.addPuzzle(line.strip())
+        except OSError:
+            pass
+
+    def save(self):
+        try:
+            os.makedirs(os.path.dirname(self._path), exist_ok=True)
+            with open(self._path, "w", encoding="utf-8") as f:
+                for puzzles in self._puzzles.values():
+                    for sudo in puzzles:
+                        f.write(repr(sudo) + "\n")
+        except OSError:
+            pass
+
+    @pyqtSlot(str)
+    def addPuzzle(self, line):
+        # a line is only queued once it parses as a classic board without
+        # clashing clues, so a damaged puzzles.txt cannot break pop()
+        try:
+            sudo = Sudoku(line)
+        except ValueError:
+            return
+        if sudo.level.value != line.split(", ", 1)[0] or sudo.rows != Sudoku.rows or sudo.conflictedCells():
+            return
+
+        # the generator can come back with an easier puzzle than asked,
+        # which is kept only while its own level has room for it
+        if len(self._puzzles[sudo.level]) < PuzzlePool.highWater:
+            self._puzzles[sudo.level].append(sudo)
+
+    def count(self, level):
+        return len(self._puzzles[level])
+
+    def pop(self, level):
+        if self._puzzles[level]:
+            sudo = self._puzzles[level].popleft()
+        else:
+            sudo = Sudoku.generateSudoku(level)
+
+        self.refill()
+        return sudo
+
+    def refill(self):
+        if self._closing or self._worker is not None and self._worker.isRunning():
+            return
+
+        demand = [(level, PuzzlePool.highWater - len(puzzles))
+                  for level, puzzles in self._puzzles.items() if len(puzzles) < PuzzlePool.lowWater]
+        if not demand:
+            return
+
+        self._worker = PuzzleWorker(demand, self)
+        self._worker.puzzleReady.connect(self.addPuzzle)
+        self._worker.finished.connect(self.refill)
+        self._worker.start(QThread.LowPriority)
+
+    def shutdown(self):
+        # no new worker once closing; the puzzles the last one queued before
+        # stopping are delivered before the pool is saved
+        self._closing = True
+        if self._worker is not None:
+            self._worker.requestInterruption()
+            self._worker.wait()
+            QCoreApplication.sendPostedEvents(self, QEvent.MetaCall)
+        self.save()
@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+# -*- coding : utf-8 -*-
+
+import time
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from sudoku import Sudoku, SolveInterrupted
+
+
+class SolveWorker(QThread):
+    SOLVED = "solved"
+    UNSOLVABLE = "unsolvable"
+    TIMEOUT = "timeout"
+    CANCELLED = "cancelled"
+
+    progress = pyqtSignal(int)
+    solved = pyqtSignal(str, str)
+
+    def __init__(self, sudo : Sudoku, timeout=10.0, parent=None):
+        super(SolveWorker, self).__init__(parent)
+        self._sudoku = sudo.copy()
+        self._timeout = timeout
+        self._status = SolveWorker.CANCELLED
+
+    def shouldStop(self):
+        if self.isInterruptionRequested():
+            self._status = SolveWorker.CANCELLED
+            return True
+
+        if time.monotonic() > self._deadline:
+            self._status = SolveWorker.TIMEOUT
+            return True
+
+        return False
+
+    def run(self):
+        self._deadline = time.monotonic() + self._timeout
+        try:
+            if self._sudoku.solveInterruptible(self.shouldStop, self.progress.emit):
+                self.solved.emit(SolveWorker.SOLVED, repr(self._sudoku))
+            else:
+                self.solved.emit(SolveWorker.UNSOLVABLE, "")
+        except SolveInterrupted:
+            self.solved.emit(self._status, "")
@@ -1,9 +1,13 @@
 #!/usr/bin/env python
 # -*- coding : utf-8 -*-
 
+import csv
+import time
 import numpy as np
+from collections import namedtuple
 from enum import Enum
-from functools import reduce
+from functools import lru_cache, reduce
+from itertools import combinations
 from typing import *
 
 
@@ -15,68 +19,1140 @@ class SudokuLevel(Enum):
     T = 'T'
 
 
+_LEVELS = list(SudokuLevel)
+
+_DIGIT_CHARS = ".123456789ABCDEFGHIJKLMNOP"
+
+_CHAR_VALUES = np.full(256, 255, dtype=np.uint8)
+_CHAR_VALUES[ord("0")] = 0
+for _value, _char in enumerate(_DIGIT_CHARS):
+    _CHAR_VALUES[ord(_char)] = _CHAR_VALUES[ord(_char.lower())] = _value
+
+_popcount = getattr(int, "bit_count", lambda m: bin(m).count("1"))
+
+
+class Geometry:
+    # Index tables for a board made of boxes x boxes boxes. Cells are indexed
+    # row-major; units are numbered rows first, then columns, boxes (or jigsaw
+    # regions), extra houses such as diagonals, and last the killer cages.
+    # The first `houses` units hold every digit once, a cage only needs
+    # distinct digits adding up to its total.
+    def __init__(self, boxes : int, regions=None, extraHouses=(), cages=()) -> None:
+        n = boxes * boxes
+        self.boxes = boxes
+        self.size = n
+        self.cells = n * n
+        self.allDigits = (1 << n) - 1
+        self.classic = regions is None and not extraHouses and not cages
+        # every cell sits in exactly a row, a column and a box or region
+        self.simple = not extraHouses and not cages
+
+        if regions is None:
+            regions = [[(br + r) * n + bc + c for r in range(boxes) for c in range(boxes)]
+                       for br in range(0, n, boxes) for bc in range(0, n, boxes)]
+        houses = [tuple(r * n + c for c in range(n)) for r in range(n)] + \
+                 [tuple(r * n + c for r in range(n)) for c in range(n)] + \
+                 [tuple(sorted(region)) for region in regions] + \
+                 [tuple(house) for house in extraHouses]
+        if len(regions) != n or any(len(region) != n for region in regions) or \
+                sorted(i for region in regions for i in region) != list(range(self.cells)):
+            raise ValueError(f"regions must split the board into {n} parts of {n} cells")
+        for house in houses:
+            if len(set(house)) != n or not 0 <= min(house) <= max(house) < self.cells:
+                raise ValueError(f"a house needs {n} distinct cells of the board, got {house}")
+
+        self.houses = len(houses)
+        self.units = houses + [tuple(cells) for cells, _ in cages]
+        self.cageSums = [int(total) for _, total in cages]
+        self.cellCage = [-1] * self.cells
+        for k, (cells, _) in enumerate(cages):
+            for idx in cells:
+                if self.cellCage[idx] >= 0:
+                    raise ValueError(f"cell {divmod(idx, n)} is in more than one cage")
+                self.cellCage[idx] = k
+
+        cellUnits = [[] for _ in range(self.cells)]
+        for u, unit in enumerate(self.units):
+            for idx in unit:
+                cellUnits[idx].append(u)
+        self.cellUnits = [tuple(units) for units in cellUnits]
+        self.peers = [tuple(sorted({p for u in self.cellUnits[i] for p in self.units[u]} - {i}))
+                      for i in range(self.cells)]
+        self.boxesFirst = list(range(2 * n, 3 * n)) + list(range(2 * n))
+
+        # position of each cell inside its units
+        self.unitPos = [tuple(self.units[u].index(i) for u in self.cellUnits[i]) for i in range(self.cells)]
+        # masks of box positions sharing a row (first `boxes` entries) or a
+        # column, and of line positions sharing a box
+        stripe = (1 << boxes) - 1
+        column = sum(1 << boxes * k for k in range(boxes))
+        self.boxLines = [stripe << boxes * k for k in range(boxes)] + [column << k for k in range(boxes)]
+        self.lineBoxes = [stripe << boxes * k for k in range(boxes)]
+
+    @staticmethod
+    def diagonal(boxes=3):
+        # X-Sudoku: both main diagonals are houses too
+        n = boxes * boxes
+        return Geometry(boxes, extraHouses=[[i * n + i for i in range(n)], [i * n + n - 1 - i for i in range(n)]])
+
+    @staticmethod
+    def jigsaw(regions):
+        # regions is an n x n array numbering the region of every cell 0..n-1
+        regions = np.asarray(regions).ravel().tolist()
+        boxes = geometryOf(len(regions)).boxes
+        return Geometry(boxes, regions=[[i for i, r in enumerate(regions) if r == k] for k in range(boxes * boxes)])
+
+    @staticmethod
+    def killer(cages, boxes=3):
+        # cages are (cells, total) pairs with the cells given as (row, col)
+        n = boxes * boxes
+        return Geometry(boxes, cages=[([row * n + col for row, col in cells], total) for cells, total in cages])
+
+
+@lru_cache(maxsize=None)
+def geometry(boxes=3):
+    if not 2 <= boxes <= 5:
+        raise ValueError(f"box size must be between 2 and 5, got {boxes}")
+    return Geometry(boxes)
+
+
+def geometryOf(cells):
+    boxes = round(cells ** 0.25)
+    if boxes ** 4 != cells:
+        raise ValueError(f"{cells} cells do not make a sudoku board")
+    return geometry(boxes)
+
+
+@lru_cache(maxsize=None)
+def _baseGrid(boxes):
+    # row r is the first row shifted by a band offset plus one box per line
+    n = boxes * boxes
+    r, c = np.indices((n, n))
+    grid = ((r % boxes * boxes + r // boxes + c) % n + 1).astype(np.int8)
+    grid.setflags(write=False)
+    return grid
+
+
+def spawnSeeds(seed, count):
+    # independent SeedSequence children, one per puzzle or worker
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    return seed.spawn(count)
+
+
+class BitmaskSolver:
+    def __init__(self, cells : Iterable[int], rng=None, variant : Geometry = None) -> None:
+        self.cells = [int(v) for v in cells]
+        self.geometry = geometryOf(len(self.cells)) if variant is None else variant
+        if self.geometry.cells != len(self.cells):
+            raise ValueError(f"{len(self.cells)} cells do not fit a {self.geometry.size}x{self.geometry.size} board")
+
+        # hidden singles only hold in houses, cages just keep their digits apart
+        self.units = self.geometry.units[:self.geometry.houses]
+        self.cellUnits = self.geometry.cellUnits
+        self.allDigits = self.geometry.allDigits
+        self.used = [0] * len(self.geometry.units)
+        self.empty = set()
+        self.consistent = True
+        self.rng = rng
+        self.nodes = 0
+
+        for idx, num in enumerate(self.cells):
+            if num == 0:
+                self.empty.add(idx)
+                continue
+
+            if not 0 < num <= self.geometry.size:
+                self.consistent = False
+                continue
+
+            bit = 1 << (num - 1)
+            for u in self.cellUnits[idx]:
+                if self.used[u] & bit:
+                    self.consistent = False
+                self.used[u] |= bit
+
+        if not self.geometry.simple:
+            # the unrolled three-unit methods only fit rows, columns and boxes
+            self.candidates = self._variantCandidates
+            self.place = self._variantPlace
+            self.unplace = self._variantUnplace
+            self.cellCage = self.geometry.cellCage
+            self.cageLeft = list(self.geometry.cageSums)
+            self.cageOpen = [0] * len(self.cageLeft)
+            for idx, num in enumerate(self.cells):
+                cage = self.cellCage[idx]
+                if cage >= 0:
+                    self.cageLeft[cage] -= num
+                    self.cageOpen[cage] += num == 0
+            if any(left < 0 or left > 0 and not count for left, count in zip(self.cageLeft, self.cageOpen)):
+                self.consistent = False
+
+    def candidates(self, idx):
+        u0, u1, u2 = self.cellUnits[idx]
+        return self.allDigits & ~(self.used[u0] | self.used[u1] | self.used[u2])
+
+    def place(self, idx, bit):
+        u0, u1, u2 = self.cellUnits[idx]
+        self.used[u0] |= bit
+        self.used[u1] |= bit
+        self.used[u2] |= bit
+        self.cells[idx] = bit.bit_length()
+        self.empty.discard(idx)
+
+    def unplace(self, idx):
+        bit = 1 << (self.cells[idx] - 1)
+        u0, u1, u2 = self.cellUnits[idx]
+        self.used[u0] &= ~bit
+        self.used[u1] &= ~bit
+        self.used[u2] &= ~bit
+        self.cells[idx] = 0
+        self.empty.add(idx)
+
+    def _cageDigits(self, cage):
+        # digits an open cell of the cage can take while the other open cells
+        # still fit between the smallest and largest sums they can make
+        n = self.geometry.size
+        left, count = self.cageLeft[cage], self.cageOpen[cage]
+        low = max(1, left - (count - 1) * (2 * n - count + 2) // 2)
+        high = min(n, left - (count - 1) * count // 2)
+        if low > high:
+            return 0
+        return ((1 << high) - 1) & ~((1 << (low - 1)) - 1)
+
+    def _variantCandidates(self, idx):
+        cand = self.allDigits
+        for u in self.cellUnits[idx]:
+            cand &= ~self.used[u]
+
+        cage = self.cellCage[idx]
+        if cage >= 0:
+            cand &= self._cageDigits(cage)
+        return cand
+
+    def _variantPlace(self, idx, bit):
+        for u in self.cellUnits[idx]:
+            self.used[u] |= bit
+        self.cells[idx] = bit.bit_length()
+        self.empty.discard(idx)
+
+        cage = self.cellCage[idx]
+        if cage >= 0:
+            self.cageLeft[cage] -= self.cells[idx]
+            self.cageOpen[cage] -= 1
+
+    def _variantUnplace(self, idx):
+        bit = 1 << (self.cells[idx] - 1)
+        for u in self.cellUnits[idx]:
+            self.used[u] &= ~bit
+
+        cage = self.cellCage[idx]
+        if cage >= 0:
+            self.cageLeft[cage] += self.cells[idx]
+            self.cageOpen[cage] += 1
+        self.cells[idx] = 0
+        self.empty.add(idx)
+
+    def undo(self, trail):
+        while trail:
+            self.unplace(trail.pop())
+
+    def propagate(self, trail, naked=True):
+        cells, used, allDigits, candidates = self.cells, self.used, self.allDigits, self.candidates
+        changed = True
+        while changed:
+            changed = False
+
+            # naked singles: a cell with exactly one candidate left
+            for idx in list(self.empty) if naked else ():
+                cand = candidates(idx)
+                if cand == 0:
+                    return False
+                if cand & (cand - 1) == 0:
+                    self.place(idx, cand)
+                    trail.append(idx)
+                    changed = True
+
+            # hidden singles: a digit with exactly one place left in a unit
+            for u, unit in enumerate(self.units):
+                once = twice = 0
+                for idx in unit:
+                    if cells[idx] == 0:
+                        cand = candidates(idx)
+                        twice |= once & cand
+                        once |= cand
+
+                if (once | used[u]) != allDigits:
+                    return False
+
+                hidden = once & ~twice
+                while hidden:
+                    bit = hidden & -hidden
+                    hidden ^= bit
+                    for idx in unit:
+                        if cells[idx] == 0 and self.candidates(idx) & bit:
+                            self.place(idx, bit)
+                            trail.append(idx)
+                            changed = True
+                            break
+                    else:
+                        return False
+
+        return True
+
+    def selectCell(self):
+        best, bestCount = -1, self.geometry.size + 1
+        for idx in self.empty:
+            count = _popcount(self.candidates(idx))
+            if count < bestCount:
+                best, bestCount = idx, count
+                if count <= 2:
+                    break
+        return best
+
+    def search(self):
+        trail = []
+        if not self.propagate(trail):
+            self.undo(trail)
+            return False
+
+        if not self.empty:
+            return True
+
+        idx = self.selectCell()
+        cand = self.candidates(idx)
+        bits = []
+        while cand:
+            bit = cand & -cand
+            cand ^= bit
+            bits.append(bit)
+
+        if self.rng is not None:
+            self.rng.shuffle(bits)
+
+        for bit in bits:
+            self.nodes += 1
+            self.place(idx, bit)
+            if self.search():
+                return True
+            self.unplace(idx)
+
+        self.undo(trail)
+        return False
+
+    def count(self, limit=None):
+        trail = []
+        if not self.consistent or not self.propagate(trail):
+            self.undo(trail)
+            return 0
+
+        if not self.empty:
+            self.undo(trail)
+            return 1
+
+        total = 0
+        idx = self.selectCell()
+        cand = self.candidates(idx)
+        while cand and (limit is None or total < limit):
+            bit = cand & -cand
+            cand ^= bit
+            self.nodes += 1
+            self.place(idx, bit)
+            total += self.count(None if limit is None else limit - total)
+            self.unplace(idx)
+
+        self.undo(trail)
+        return total
+
+    def solve(self):
+        return self.consistent and self.search()
+
+
+class SolveStats:
+    FIELDS = ["label", "engine", "solved", "nodes", "backtracks", "propagations", "maxDepth", "seconds"]
+
+    def __init__(self, label="", engine="") -> None:
+        self.label = label
+        self.engine = engine
+        self.solved = False
+        self.nodes = 0
+        self.backtracks = 0
+        self.propagations = 0
+        self.maxDepth = 0
+        self.seconds = 0.0
+
+    def asDict(self):
+        return {field : getattr(self, field) for field in SolveStats.FIELDS}
+
+    def __repr__(self):
+        return "SolveStats(" + ", ".join(f"{k}={v!r}" for k, v in self.asDict().items()) + ")"
+
+
+def dumpStats(stats : Iterable[SolveStats], stream):
+    writer = csv.DictWriter(stream, fieldnames=SolveStats.FIELDS)
+    writer.writeheader()
+    for s in stats:
+        writer.writerow(s.asDict())
+
+
+# The tracing variants only exist so the plain solvers carry no bookkeeping
+# when nobody asked for statistics.
+class TracingBitmaskSolver(BitmaskSolver):
+    def __init__(self, cells : Iterable[int], stats : SolveStats, rng=None, variant : Geometry = None) -> None:
+        super(TracingBitmaskSolver, self).__init__(cells, rng, variant)
+        self.stats = stats
+        self.depth = 0
+
+    def propagate(self, trail, naked=True):
+        before = len(trail)
+        result = super(TracingBitmaskSolver, self).propagate(trail, naked)
+        self.stats.propagations += len(trail) - before
+        return result
+
+    def search(self):
+        stats = self.stats
+        stats.nodes += 1
+        self.depth += 1
+        stats.maxDepth = max(stats.maxDepth, self.depth)
+
+        found = super(TracingBitmaskSolver, self).search()
+
+        self.depth -= 1
+        if not found:
+            stats.backtracks += 1
+        return found
+
+
+class SolveInterrupted(Exception):
+    pass
+
+
+class InterruptibleBitmaskSolver(BitmaskSolver):
+    def __init__(self, cells : Iterable[int], shouldStop, progress=None, checkEvery=64,
+                 variant : Geometry = None) -> None:
+        super(InterruptibleBitmaskSolver, self).__init__(cells, variant=variant)
+        self.shouldStop = shouldStop
+        self.progress = progress
+        self.checkEvery = checkEvery
+        self.calls = 0
+
+    def search(self):
+        self.calls += 1
+        if self.calls % self.checkEvery == 0:
+            if self.shouldStop():
+                raise SolveInterrupted()
+            if self.progress is not None:
+                self.progress(self.calls)
+
+        return super(InterruptibleBitmaskSolver, self).search()
+
+
+Step = namedtuple("Step", ["technique", "cells", "placements", "eliminations"])
+
+TECHNIQUE_LEVELS = {
+    "hidden single" : SudokuLevel.P,
+    "naked single" : SudokuLevel.M,
+    "pointing" : SudokuLevel.H,
+    "claiming" : SudokuLevel.H,
+    "naked pair" : SudokuLevel.H,
+    "hidden pair" : SudokuLevel.H,
+    "naked triple" : SudokuLevel.S,
+    "hidden triple" : SudokuLevel.S,
+    "x-wing" : SudokuLevel.S,
+}
+
+
+class StepSolver:
+    # Works on classic boards only: the locked candidate tables assume boxes.
+    def __init__(self, cells : Iterable[int]) -> None:
+        self.cells = [int(v) for v in cells]
+        self.geometry = geo = geometryOf(len(self.cells))
+        self.size = geo.size
+        self.cand = [0] * len(self.cells)
+        self.emptyCount = 0
+        # where[u][num] is the mask of positions inside unit u still open for num
+        self.where = [[0] * (geo.size + 1) for _ in geo.units]
+
+        for idx, num in enumerate(self.cells):
+            if num != 0:
+                continue
+
+            used = 0
+            for p in geo.peers[idx]:
+                if self.cells[p]:
+                    used |= 1 << (self.cells[p] - 1)
+            self.cand[idx] = cand = geo.allDigits & ~used
+            self.emptyCount += 1
+
+            while cand:
+                bit = cand & -cand
+                cand ^= bit
+                for u, pos in zip(geo.cellUnits[idx], geo.unitPos[idx]):
+                    self.where[u][bit.bit_length()] |= 1 << pos
+
+    def _remove(self, idx, mask):
+        removed = self.cand[idx] & mask
+        if not removed:
+            return
+
+        self.cand[idx] ^= removed
+        while removed:
+            bit = removed & -removed
+            removed ^= bit
+            num = bit.bit_length()
+            for u, pos in zip(self.geometry.cellUnits[idx], self.geometry.unitPos[idx]):
+                self.where[u][num] &= ~(1 << pos)
+
+    def place(self, idx, num):
+        bit = 1 << (num - 1)
+        self._remove(idx, self.geometry.allDigits)
+        self.cells[idx] = num
+        self.emptyCount -= 1
+        for p in self.geometry.peers[idx]:
+            self._remove(p, bit)
+
+    def eliminate(self, idx, num):
+        self._remove(idx, 1 << (num - 1))
+
+    def apply(self, step):
+        for row, col, num in step.placements:
+            self.place(row * self.size + col, num)
+        for row, col, num in step.eliminations:
+            self.eliminate(row * self.size + col, num)
+
+    def isSolved(self):
+        return self.emptyCount == 0
+
+    def isBroken(self):
+        return any(self.cells[idx] == 0 and self.cand[idx] == 0 for idx in range(len(self.cells)))
+
+    def nextStep(self, apply=True):
+        for finder in (self.findHiddenSingle, self.findNakedSingle, self.findLockedCandidates,
+                       self.findNakedSubset, self.findHiddenSubset, self.findXWing):
+            step = finder()
+            if step is not None:
+                if apply:
+                    self.apply(step)
+                return step
+
+        return None
+
+    def solve(self):
+        # Steps until solved or stuck; returns the level of the hardest
+        # technique used, or SudokuLevel.T when the techniques run out.
+        hardest = 0
+        while not self.isSolved():
+            step = self.nextStep()
+            if step is None or self.isBroken():
+                return SudokuLevel.T
+            hardest = max(hardest, _LEVELS.index(TECHNIQUE_LEVELS[step.technique]))
+
+        return _LEVELS[hardest]
+
+    def _step(self, technique, cells, placements=(), eliminations=()):
+        n = self.size
+        return Step(technique, [divmod(idx, n) for idx in cells],
+                    [divmod(idx, n) + (num,) for idx, num in placements],
+                    [divmod(idx, n) + (num,) for idx, num in eliminations])
+
+    def _eliminations(self, cells, mask):
+        result = []
+        for idx in cells:
+            common = self.cand[idx] & mask
+            while common:
+                bit = common & -common
+                common ^= bit
+                result.append((idx, bit.bit_length()))
+        return result
+
+    def _cellsOf(self, unit, positions):
+        return [idx for k, idx in enumerate(self.geometry.units[unit]) if positions >> k & 1]
+
+    def findHiddenSingle(self):
+        # boxes first, they are the easiest to spot
+        for u in self.geometry.boxesFirst:
+            for num, positions in enumerate(self.where[u]):
+                if positions and positions & (positions - 1) == 0:
+                    idx = self.geometry.units[u][positions.bit_length() - 1]
+                    return self._step("hidden single", [idx], [(idx, num)])
+
+        return None
+
+    def findNakedSingle(self):
+        for idx, cand in enumerate(self.cand):
+            if cand and cand & (cand - 1) == 0:
+                return self._step("naked single", [idx], [(idx, cand.bit_length())])
+
+        return None
+
+    def findLockedCandidates(self):
+        geo = self.geometry
+        for u in range(len(geo.units)):
+            isBox = u >= 2 * geo.size
+            for num, positions in enumerate(self.where[u]):
+                if _popcount(positions) < 2:
+                    continue
+
+                # pointing: a box's candidates lie in one row or column,
+                # claiming: a line's candidates lie in one box
+                for i, line in enumerate(geo.boxLines if isBox else geo.lineBoxes):
+                    if positions & ~line:
+                        continue
+
+                    cells = self._cellsOf(u, positions)
+                    k = (0 if i < geo.boxes else 1) if isBox else 2
+                    other = [idx for idx in geo.units[geo.cellUnits[cells[0]][k]] if idx not in cells]
+                    elims = self._eliminations(other, 1 << (num - 1))
+                    if elims:
+                        return self._step("pointing" if isBox else "claiming", cells, eliminations=elims)
+
+        return None
+
+    def findNakedSubset(self):
+        units = self.geometry.units
+        for size, technique in ((2, "naked pair"), (3, "naked triple")):
+            for u in range(len(units)):
+                cells = [idx for idx in units[u] if 2 <= _popcount(self.cand[idx]) <= size]
+                for subset in combinations(cells, size):
+                    mask = 0
+                    for idx in subset:
+                        mask |= self.cand[idx]
+                    if _popcount(mask) != size:
+                        continue
+
+                    elims = self._eliminations([idx for idx in units[u] if idx not in subset], mask)
+                    if elims:
+                        return self._step(technique, subset, eliminations=elims)
+
+        return None
+
+    def findHiddenSubset(self):
+        for size, technique in ((2, "hidden pair"), (3, "hidden triple")):
+            for u in range(len(self.geometry.units)):
+                digits = [num for num, positions in enumerate(self.where[u]) if 2 <= _popcount(positions) <= size]
+                for subset in combinations(digits, size):
+                    positions = mask = 0
+                    for num in subset:
+                        positions |= self.where[u][num]
+                        mask |= 1 << (num - 1)
+                    if _popcount(positions) != size:
+                        continue
+
+                    cells = self._cellsOf(u, positions)
+                    elims = self._eliminations(cells, self.geometry.allDigits & ~mask)
+                    if elims:
+                        return self._step(technique, cells, eliminations=elims)
+
+        return None
+
+    def findXWing(self):
+        n = self.size
+        for num in range(1, n + 1):
+            bit = 1 << (num - 1)
+            # rows crossing columns, then columns crossing rows; a line's
+            # positions are the indexes of the crossing lines
+            for base, cross in ((0, n), (n, 0)):
+                seen = {}
+                for u in range(base, base + n):
+                    positions = self.where[u][num]
+                    if _popcount(positions) != 2:
+                        continue
+                    if positions not in seen:
+                        seen[positions] = u
+                        continue
+
+                    cells = self._cellsOf(seen[positions], positions) + self._cellsOf(u, positions)
+                    other = [idx for k in range(n) if positions >> k & 1
+                             for idx in self.geometry.units[cross + k] if idx not in cells]
+                    elims = self._eliminations(other, bit)
+                    if elims:
+                        return self._step("x-wing", cells, eliminations=elims)
+
+        return None
+
+
+class DancingLinks:
+    def __init__(self, columns : int, rows : Iterable[Iterable[int]]) -> None:
+        # node 0 is the root, nodes 1..columns are the column headers
+        self.L = [columns] + list(range(columns))
+        self.R = list(range(1, columns + 1)) + [0]
+        self.U = list(range(columns + 1))
+        self.D = list(range(columns + 1))
+        self.C = list(range(columns + 1))
+        self.size = [0] * (columns + 1)
+        self.rowOf = [-1] * (columns + 1)
+
+        L, R, U, D, C = self.L, self.R, self.U, self.D, self.C
+        for r, cols in enumerate(rows):
+            first = -1
+            for col in cols:
+                col += 1
+                node = len(C)
+                U.append(U[col])
+                D.append(col)
+                D[U[col]] = node
+                U[col] = node
+                C.append(col)
+                self.size[col] += 1
+                self.rowOf.append(r)
+
+                if first < 0:
+                    first = node
+                    L.append(node)
+                    R.append(node)
+                else:
+                    L.append(L[first])
+                    R.append(first)
+                    R[L[first]] = node
+                    L[first] = node
+
+    def cover(self, c):
+        L, R, U, D, C, size = self.L, self.R, self.U, self.D, self.C, self.size
+        R[L[c]] = R[c]
+        L[R[c]] = L[c]
+        i = D[c]
+        while i != c:
+            j = R[i]
+            while j != i:
+                U[D[j]] = U[j]
+                D[U[j]] = D[j]
+                size[C[j]] -= 1
+                j = R[j]
+            i = D[i]
+
+    def uncover(self, c):
+        L, R, U, D, C, size = self.L, self.R, self.U, self.D, self.C, self.size
+        i = U[c]
+        while i != c:
+            j = L[i]
+            while j != i:
+                size[C[j]] += 1
+                U[D[j]] = j
+                D[U[j]] = j
+                j = L[j]
+            i = U[i]
+        R[L[c]] = c
+        L[R[c]] = c
+
+    def search(self, solution=None):
+        if solution is None:
+            solution = []
+
+        R = self.R
+        if R[0] == 0:
+            yield list(solution)
+            return
+
+        best, c = R[0], R[0]
+        while c != 0:
+            if self.size[c] < self.size[best]:
+                best = c
+            c = R[c]
+
+        if self.size[best] == 0:
+            return
+
+        L, D, C = self.L, self.D, self.C
+        self.cover(best)
+        r = D[best]
+        while r != best:
+            solution.append(self.rowOf[r])
+            j = R[r]
+            while j != r:
+                self.cover(C[j])
+                j = R[j]
+
+            yield from self.search(solution)
+
+            j = L[r]
+            while j != r:
+                self.uncover(C[j])
+                j = L[j]
+            solution.pop()
+            r = D[r]
+        self.uncover(best)
+
+
+class TracingDancingLinks(DancingLinks):
+    def __init__(self, columns : int, rows : Iterable[Iterable[int]], stats : SolveStats) -> None:
+        super(TracingDancingLinks, self).__init__(columns, rows)
+        self.stats = stats
+
+    def cover(self, c):
+        self.stats.propagations += 1
+        super(TracingDancingLinks, self).cover(c)
+
+    def search(self, solution=None):
+        stats = self.stats
+        stats.nodes += 1
+        stats.maxDepth = max(stats.maxDepth, len(solution) + 1 if solution else 1)
+
+        found = False
+        for result in super(TracingDancingLinks, self).search(solution):
+            found = True
+            yield result
+
+        if not found:
+            stats.backtracks += 1
+
+
+def dlxSolutions(cells : Iterable[int], stats : SolveStats = None, variant : Geometry = None):
+    # Exact cover over the constraints left open by the givens: every empty cell
+    # needs one digit and every house needs each of its missing digits.
+    if variant is not None and variant.cageSums:
+        raise ValueError("dancing links cannot check killer cage sums")
+
+    state = BitmaskSolver(cells, variant=variant)
+    if not state.consistent:
+        return
+
+    cells = state.cells
+    columns = {}
+    for idx in state.empty:
+        columns[idx] = len(columns)
+    for u in range(len(state.units)):
+        missing = state.allDigits & ~state.used[u]
+        while missing:
+            bit = missing & -missing
+            missing ^= bit
+            columns[(u, bit)] = len(columns)
+
+    choices, rows = [], []
+    for idx in state.empty:
+        cand = state.candidates(idx)
+        while cand:
+            bit = cand & -cand
+            cand ^= bit
+            choices.append((idx, bit.bit_length()))
+            rows.append([columns[idx]] + [columns[(u, bit)] for u in state.cellUnits[idx]])
+
+    if stats is None:
+        links = DancingLinks(len(columns), rows)
+    else:
+        links = TracingDancingLinks(len(columns), rows, stats)
+
+    for solution in links.search():
+        result = list(cells)
+        for r in solution:
+            idx, num = choices[r]
+            result[idx] = num
+        yield result
+
+
+def _popcountArray(masks):
+    # elementwise bit count of a uint32 array; SWAR where numpy lacks bitwise_count
+    masks = masks - ((masks >> 1) & 0x55555555)
+    masks = (masks & 0x33333333) + ((masks >> 2) & 0x33333333)
+    masks = (masks + (masks >> 4)) & 0x0F0F0F0F
+    return (masks * 0x01010101) >> 24
+
+
+_popcountArray = getattr(np, "bitwise_count", _popcountArray)
+
+
+@lru_cache(maxsize=None)
+def _batchTables(boxes):
+    geo = geometry(boxes)
+    return np.array(geo.units, dtype=np.intp), np.array(geo.cellUnits, dtype=np.intp), np.uint32(geo.allDigits)
+
+
+def _propagateBatch(boards):
+    # Singles elimination over a (N, n, n) stack, every step vectorized over N.
+    # Each board is a row of per-cell digit bitmasks kept from round to round,
+    # so a round is a handful of gathers and bit operations on (N, cells)
+    # arrays; boards leave the stack as soon as they are solved, fail or
+    # stall. Returns the propagated boards together with the solved and
+    # failed flags.
+    count, size = len(boards), boards.shape[-1]
+    units, cellUnits, full = _batchTables(geometryOf(size * size).boxes)
+    cells = boards.reshape(count, -1)
+    masks = np.where(cells > 0, np.uint32(1) << (cells.astype(np.uint32) - 1), np.uint32(0))
+    solved = np.zeros(count, dtype=bool)
+    failed = np.zeros(count, dtype=bool)
+    active = np.arange(count)
+    m = masks
+
+    while active.size:
+        placed = m[:, units]
+        used = np.bitwise_or.reduce(placed, axis=2)
+        empty = m == 0
+        cand = np.where(empty, full & ~np.bitwise_or.reduce(used[:, cellUnits], axis=2), np.uint32(0))
+
+        # digits with at least one and at least two places in each unit
+        places = cand[:, units]
+        once = np.zeros_like(used)
+        twice = np.zeros_like(used)
+        for j in range(size):
+            twice |= once & places[:, :, j]
+            once |= places[:, :, j]
+
+        # distinct bits sum to their OR, a repeated digit does not
+        bad = (placed.sum(axis=2, dtype=np.uint32) != used).any(axis=1) | \
+              (empty & (cand == 0)).any(axis=1) | ((once | used) != full).any(axis=1)
+
+        hidden = cand & np.bitwise_or.reduce((once & ~twice)[:, cellUnits], axis=2)
+        place = np.where(_popcountArray(cand) == 1, cand, hidden & (~hidden + np.uint32(1)))
+        m = m | place
+
+        finished = ~empty.any(axis=1)
+        failed[active[bad]] = True
+        solved[active[~bad & finished]] = True
+        keep = ~bad & (place != 0).any(axis=1)
+        masks[active[~keep]] = m[~keep]
+        active = active[keep]
+        m = m[keep]
+
+    # a placed mask has a single bit, its digit is one more than the bits below it
+    boards[:] = np.where(masks != 0, _popcountArray(masks - np.uint32(1)) + 1, 0).reshape(boards.shape)
+    return boards, solved, failed
+
+
 class Sudoku:
     rows = 9
     cols = 9
     boxes = 3
 
-    def __init__(self, sudo : str = None) -> None:
+    def __init__(self, sudo : str = None, boxes : int = 3, variant : Geometry = None) -> None:
         self._level = SudokuLevel.P
-        self._boards = np.zeros((Sudoku.rows, Sudoku.cols), dtype=np.int8)
+        self._resize(boxes if variant is None else variant.boxes, variant)
 
         if sudo is not None:
             self.loadFomString(sudo)
 
+    def _resize(self, boxes, variant=None):
+        # rows/cols/boxes shadow the classic 9x9 class defaults per instance
+        self._geometry = geometry(boxes) if variant is None else variant
+        self.boxes = boxes
+        self.rows = self.cols = boxes * boxes
+        self._boards = np.zeros((self.rows, self.cols), dtype=np.int8)
+        # pencil marks, bit num - 1 set for every digit noted in a cell
+        self._notes = np.zeros((self.rows, self.cols), dtype=np.uint16 if self.rows <= 16 else np.uint32)
+        self._unitCounts = None
+
     def __getitem__(self, index):
         return self._boards[index]
 
     def __setitem__(self, key, value):
+        if self._unitCounts is None or type(key) is not tuple or \
+                not all(isinstance(k, (int, np.integer)) for k in key):
+            self._boards[key] = value
+            self._unitCounts = None
+            return
+
+        old = int(self._boards[key])
         self._boards[key] = value
+        new = int(self._boards[key])
+        if old != new:
+            row, col = key
+            self._updateIndex((row % self.rows) * self.cols + col % self.cols, old, new)
+
+    def _setBoards(self, cells):
+        cells = np.asarray(cells, dtype=np.int8)
+        if cells.size != self.rows * self.cols:
+            self._resize(geometryOf(cells.size).boxes)
+
+        self._boards[:, :] = cells.reshape(self.rows, self.cols)
+        self._notes[:, :] = 0
+        self._unitCounts = None
+
+    def _buildIndex(self):
+        # Digit counts and bitmasks per unit, the number of empty cells and the
+        # (unit, digit) pairs placed more than once, kept up to date by __setitem__.
+        self._unitCounts = [[0] * (self.rows + 1) for _ in self._geometry.units]
+        self._unitUsed = [0] * len(self._geometry.units)
+        self._emptyCount = 0
+        self._conflicts = set()
+
+        for idx, num in enumerate(self._boards.ravel().tolist()):
+            if num == 0:
+                self._emptyCount += 1
+                continue
+            for u in self._geometry.cellUnits[idx]:
+                self._unitCounts[u][num] += 1
+                self._unitUsed[u] |= 1 << (num - 1)
+                if self._unitCounts[u][num] > 1:
+                    self._conflicts.add((u, num))
+
+    def _ensureIndex(self):
+        if self._unitCounts is None:
+            self._buildIndex()
+
+    def _updateIndex(self, idx, old, new):
+        if old == 0:
+            self._emptyCount -= 1
+        else:
+            for u in self._geometry.cellUnits[idx]:
+                self._unitCounts[u][old] -= 1
+                if self._unitCounts[u][old] == 1:
+                    self._conflicts.discard((u, old))
+                elif self._unitCounts[u][old] == 0:
+                    self._unitUsed[u] &= ~(1 << (old - 1))
+
+        if new == 0:
+            self._emptyCount += 1
+        else:
+            for u in self._geometry.cellUnits[idx]:
+                self._unitCounts[u][new] += 1
+                self._unitUsed[u] |= 1 << (new - 1)
+                if self._unitCounts[u][new] == 2:
+                    self._conflicts.add((u, new))
 
     def findEmpty(self):
-        for i in range(Sudoku.rows):
-            for j in range(Sudoku.cols):
+        for i in range(self.rows):
+            for j in range(self.cols):
                 if self[i, j] == 0:
                     return i, j
-        return Sudoku.rows, Sudoku.cols
+        return self.rows, self.cols
 
     def isSolved(self):
-        row, col = self.findEmpty()
-        return True if row >= Sudoku.rows or col >= Sudoku.cols else False
-
-    def isValid(self, row, col, num):
-        if num in self[row, :]:
+        self._ensureIndex()
+        if self._emptyCount or self._conflicts:
             return False
 
-        if num in self[:, col]:
-            return False
+        cells = self._boards.ravel()
+        geo = self._geometry
+        return all(cells[list(geo.units[geo.houses + k])].sum() == total for k, total in enumerate(geo.cageSums))
+
+    def hasConflict(self, row, col):
+        self._ensureIndex()
+        num = self._boards.item(row, col)
+        return num != 0 and any(self._unitCounts[u][num] > 1 for u in self._geometry.cellUnits[row * self.cols + col])
 
-        rowBlockStart = row // Sudoku.boxes * Sudoku.boxes
-        rowBlockEnd = rowBlockStart + Sudoku.boxes
-        colBlockStart = col // Sudoku.boxes * Sudoku.boxes
-        colBlockEnd = colBlockStart + Sudoku.boxes
+    def conflictedCells(self):
+        self._ensureIndex()
+        cells = self._boards.ravel()
+        pos = set()
+        for u, num in self._conflicts:
+            for idx in self._geometry.units[u]:
+                if cells[idx] == num:
+                    pos.add(divmod(idx, self.cols))
+
+        return pos
 
-        if num in self[rowBlockStart : rowBlockEnd, colBlockStart : colBlockEnd]:
+    def isValid(self, row, col, num):
+        if not self.findAllowedNumber(row, col) >> (num - 1) & 1:
             return False
 
+        idx = row * self.cols + col
+        cage = self._geometry.cellCage[idx]
+        if cage >= 0:
+            # the cage must still be able to reach its total
+            item = self._boards.item
+            placed, gaps = num, 0
+            for p in self._geometry.units[self._geometry.houses + cage]:
+                if p != idx:
+                    placed += item(p)
+                    gaps += item(p) == 0
+            total = self._geometry.cageSums[cage]
+            if placed + gaps * (gaps + 1) // 2 > total or (gaps == 0 and placed != total):
+                return False
+
         return True
 
-    def solve(self):
+    def solve(self, engine="backtrack", stats : SolveStats = None):
+        solvers = {
+            "backtrack" : self.solveBacktrack,
+            "bitmask" : self.solveBitmask,
+            "dlx" : self.solveDlx,
+        }
+
+        if engine not in solvers:
+            raise ValueError(f"unknown solver engine: {engine}")
+
+        if stats is None:
+            return solvers[engine]()
+
+        stats.engine = engine
+        start = time.perf_counter()
+        stats.solved = solvers[engine](stats)
+        stats.seconds = time.perf_counter() - start
+        return stats.solved
+
+    def solveBacktrack(self, stats : SolveStats = None):
+        if stats is not None:
+            return self._solveBacktrackTraced(stats, 1)
+
+        row, col = self.findEmpty()
+        if row >= self.rows or col >= self.cols:
+            return True
+
+        for num in range(1, self.rows + 1):
+            if self.isValid(row, col, num):
+                self[row, col] = num
+
+                if self.solveBacktrack():
+                    return True
+
+                self[row, col] = 0
+
+        return False
+
+    def _solveBacktrackTraced(self, stats, depth):
+        stats.nodes += 1
+        stats.maxDepth = max(stats.maxDepth, depth)
         row, col = self.findEmpty()
-        if row >= Sudoku.rows or col >= Sudoku.cols:
+        if row >= self.rows or col >= self.cols:
             return True
 
-        for num in range(1, Sudoku.rows + 1):
+        for num in range(1, self.rows + 1):
             if self.isValid(row, col, num):
                 self[row, col] = num
 
-                if self.solve():
+                if self._solveBacktrackTraced(stats, depth + 1):
                     return True
 
                 self[row, col] = 0
 
+        stats.backtracks += 1
+        return False
+
+    def solveBitmask(self, stats : SolveStats = None):
+        if stats is None:
+            solver = BitmaskSolver(self._boards.ravel(), variant=self._geometry)
+        else:
+            solver = TracingBitmaskSolver(self._boards.ravel(), stats, variant=self._geometry)
+
+        if not solver.solve():
+            return False
+
+        self._setBoards(solver.cells)
+        return True
+
+    def solveInterruptible(self, shouldStop, progress=None):
+        # Polls shouldStop() every few search nodes and raises SolveInterrupted
+        # when it returns True, leaving the board untouched.
+        solver = InterruptibleBitmaskSolver(self._boards.ravel(), shouldStop, progress, variant=self._geometry)
+        if not solver.solve():
+            return False
+
+        self._setBoards(solver.cells)
+        return True
+
+    def solveDlx(self, stats : SolveStats = None):
+        for cells in dlxSolutions(self._boards.ravel(), stats, self._geometry):
+            self._setBoards(cells)
+            return True
+
         return False
 
+    def solveAll(self):
+        for cells in dlxSolutions(self._boards.ravel(), variant=self._geometry):
+            sudo = self.copy()
+            sudo._setBoards(cells)
+            yield sudo
+
+    def countSolutions(self, limit=2):
+        if self._geometry.cageSums:
+            return BitmaskSolver(self._boards.ravel(), variant=self._geometry).count(limit)
+
+        count = 0
+        for _ in dlxSolutions(self._boards.ravel(), variant=self._geometry):
+            count += 1
+            if limit is not None and count >= limit:
+                break
+
+        return count
+
     # def solveWithCached(self):
     #     row, col = self.findEmpty()
     #     if row >= Sudoku.rows or col >= Sudoku.cols:
@@ -94,78 +1170,247 @@ class Sudoku:
     #     return False
 
     @staticmethod
-    def generateSudoku(level=SudokuLevel.M):
-        maskRateTable = {
-            SudokuLevel.P : 0.4,
-            SudokuLevel.M : 0.5,
-            SudokuLevel.H : 0.6,
-            SudokuLevel.S : 0.7,
-            SudokuLevel.T : 0.8
+    def generateGrid(rng=None, boxes=3, method="pattern"):
+        # "pattern" shuffles a fixed valid grid, "solver" fills an empty board
+        # with randomized search: slower, but it reaches every solution grid
+        # rather than the symmetry class of one.
+        rng = np.random.default_rng(rng)
+        if method == "pattern":
+            return Sudoku.shuffleGrid(_baseGrid(boxes), rng, boxes)
+        if method != "solver":
+            raise ValueError(f"unknown grid method: {method}")
+
+        size = boxes * boxes
+        solver = BitmaskSolver([0] * (size * size), rng=rng)
+        solver.solve()
+
+        return np.array(solver.cells, dtype=np.int8).reshape(size, size)
+
+    @staticmethod
+    def shuffleGrid(grid, rng=None, boxes=3):
+        # A uniformly random validity preserving symmetry of the grid: band
+        # and stack order, line order inside each, transposition and digit
+        # relabeling.
+        rng = np.random.default_rng(rng)
+        lines = np.tile(np.arange(boxes), (boxes, 1))
+        rows = (rng.permutation(boxes)[:, None] * boxes + rng.permuted(lines, axis=1)).ravel()
+        cols = (rng.permutation(boxes)[:, None] * boxes + rng.permuted(lines, axis=1)).ravel()
+        digits = np.concatenate(([0], rng.permutation(boxes * boxes) + 1)).astype(np.int8)
+
+        grid = digits[np.asarray(grid)[np.ix_(rows, cols)]]
+        return grid.T.copy() if rng.random() < 0.5 else grid
+
+    @staticmethod
+    def generateSudoku(level=SudokuLevel.M, rng=None, attempts=20, boxes=3, gridMethod="pattern"):
+        # rng takes whatever np.random.default_rng does: None for fresh
+        # entropy, a seed, a SeedSequence or a Generator to draw from. When
+        # none of the attempts reaches the level, the hardest puzzle found is
+        # returned, labelled with the easier level it actually rates.
+        rng = np.random.default_rng(rng)
+
+        # Fewest clues to aim for on a 9x9 board, scaled for other sizes: below
+        # it a puzzle is only kept once it also rates at the requested level.
+        clueTable = {
+            SudokuLevel.P : 45,
+            SudokuLevel.M : 36,
+            SudokuLevel.H : 30,
+            SudokuLevel.S : 26,
+            SudokuLevel.T : 22
         }
 
-        rate = maskRateTable[level]
-
-        while True:
-            m = np.zeros((Sudoku.rows, Sudoku.cols), dtype=np.int8)
-            n = Sudoku.rows
-            rg = np.arange(1, n + 1)
-            m[0, :] = np.random.choice(rg, n, replace=False)
-            try :
-                for r in range(1, n):
-                    for c in range(n):
-                        colRest = np.setdiff1d(rg, m[:r, c])
-                        rowRest = np.setdiff1d(rg, m[r, :c])
-                        avb1 = np.intersect1d(colRest, rowRest)
-                        boxR, boxC = r//3 * 3, c//3 * 3
-                        avb2 = np.setdiff1d(np.arange(0, n+1), m[boxR : boxR + 3, boxC : boxC + 3].ravel())
-                        avb = np.intersect1d(avb1, avb2)
-                        m[r, c] = np.random.choice(avb, size=1)
+        target = _LEVELS.index(level)
+        best, bestRank = None, -1
+        for _ in range(attempts):
+            sudo = Sudoku(boxes=boxes)
+            sudo._setBoards(Sudoku.generateGrid(rng, boxes, gridMethod))
+            clues = sudo.rows * sudo.cols
+            targetClues = round(clueTable[level] * clues / 81)
+            rank = 0
+
+            for idx in rng.permutation(sudo.rows * sudo.cols):
+                if clues <= targetClues and rank >= target:
+                    break
+
+                row, col = divmod(int(idx), sudo.cols)
+                num = sudo[row, col]
+                sudo[row, col] = 0
+                # every technique rate() applies is a forced deduction, so only
+                # a puzzle it gets stuck on still needs the uniqueness count
+                rating = Sudoku._rate(sudo._boards.ravel(), solvable=True)
+                newRank = _LEVELS.index(rating)
+                if newRank > target or \
+                        (rating == SudokuLevel.T and BitmaskSolver(sudo._boards.ravel()).count(limit=2) != 1):
+                    sudo[row, col] = num
+                    continue
+
+                rank = newRank
+                clues -= 1
+
+            if rank > bestRank:
+                best, bestRank = sudo, rank
+            if rank >= target:
                 break
-            except ValueError:
-                pass
 
-        mm = m.copy()
-        mm[np.random.choice([True, False], size=m.shape, p=[rate, 1 - rate])] = 0
+        best._level = _LEVELS[bestRank]
+        return best
+
+    def _requireClassic(self):
+        if not self._geometry.classic:
+            raise ValueError("technique rating only supports classic sudoku boards")
+
+    @staticmethod
+    def generateBatch(level=SudokuLevel.M, count=1, seed=None, boxes=3, gridMethod="pattern"):
+        # Puzzle i only depends on the i-th child of the seed, so any split of
+        # the batch across workers reproduces this sequential output.
+        return [Sudoku.generateSudoku(level, rng=child, boxes=boxes, gridMethod=gridMethod)
+                for child in spawnSeeds(seed, count)]
 
-        return Sudoku(level.value + ', ' + ", ".join(map(str, mm.ravel())))
+    def rate(self):
+        self._requireClassic()
+        return self._rate(self._boards.ravel())
+
+    @staticmethod
+    def _rate(cells, solvable=False):
+        # Graded by the techniques a solve needs: hidden singles only, all
+        # singles, then the hardest step StepSolver has to take. The generator
+        # passes solvable=True, its boards always come from a full grid.
+        solver = BitmaskSolver(cells)
+        trail = []
+        if not solver.consistent or not solver.propagate(trail, naked=False):
+            return None
+        if not solver.empty:
+            return SudokuLevel.P
+
+        if not solver.propagate(trail):
+            return None
+        if not solver.empty:
+            return SudokuLevel.M
+
+        # a finished step solve is a solution, only a stuck one needs a search
+        level = StepSolver(solver.cells).solve()
+        if level == SudokuLevel.T and not solvable and solver.count(limit=1) == 0:
+            return None
+        return level
+
+    def nextStep(self):
+        self._requireClassic()
+        return StepSolver(self._boards.ravel()).nextStep(apply=False)
+
+    @staticmethod
+    def solveBatch(boards : np.ndarray, chunkSize=4096):
+        origin = np.asarray(boards, dtype=np.int8)
+        size = origin.shape[-1]
+        origin = origin.reshape(-1, size, size)
+        result = origin.copy()
+        solved = np.zeros(len(origin), dtype=bool)
+
+        for start in range(0, len(origin), chunkSize):
+            chunk, chunkSolved, chunkFailed = _propagateBatch(result[start : start + chunkSize])
+            result[start : start + chunkSize] = chunk
+            solved[start : start + chunkSize] = chunkSolved
+
+            # only the boards singles could not finish go through the per-board search
+            for i in np.flatnonzero(~chunkSolved & ~chunkFailed):
+                solver = BitmaskSolver(chunk[i].ravel())
+                if solver.solve():
+                    result[start + i] = np.array(solver.cells, dtype=np.int8).reshape(size, size)
+                    solved[start + i] = True
+
+        result[~solved] = origin[~solved]
+        return result, solved
 
     def findAllowedNumber(self, row, col):
-        colRest = self[row, :].tolist()
-        rowRest = self[:, col].tolist()
-        boxRest = self[row//3 * 3:row//3 * 3 + 3, col//3 * 3:col//3 * 3 + 3].ravel().tolist()
-        return np.array(set(range(self.rows + 1)) - set(colRest + rowRest + boxRest))
+        # Bitmask with bit num - 1 set for every digit none of the cell's units
+        # holds yet, its own digit included, read off the unit index.
+        self._ensureIndex()
+        used = 0
+        for u in self._geometry.cellUnits[row * self.cols + col]:
+            used |= self._unitUsed[u]
+        return self._geometry.allDigits & ~used
 
     def findConflictedNumber(self, row, col, num):
-        pos = set()
-        colRest = np.argwhere(self[row, :] == num)
-        for y in colRest:
-            pos.add((row, y[0]))
+        # (row, col) of every cell sharing a unit with this one that holds num,
+        # the cell itself included
+        self._ensureIndex()
+        item = self._boards.item
+        found = ()
+        for u in self._geometry.cellUnits[row * self.cols + col]:
+            if self._unitCounts[u][num]:
+                for p in self._geometry.units[u]:
+                    if item(p) == num and p not in found:
+                        found += (p,)
 
-        rowRest = np.argwhere(self[:, col] == num)
-        for x in rowRest:
-            pos.add((x[0], col))
-        boxRest = np.argwhere(self[row//3 * 3 : row//3 * 3 + 3, col//3 * 3 : col//3 * 3 + 3] == num)
-        for p in boxRest:
-            pos.add((p[0] + row//3 * 3, p[1]+col//3 * 3))
-
-        return np.array(pos)
+        return tuple(divmod(p, self.cols) for p in found)
 
     def findConflictedPos(self, row, col):
-        back = self[row, col]
-        self[row, col] = 0
-        result = self._findConflictedNumber(row, col, back)
-        self[row, col] = back
-        if len(result) != 0:
-            result.add((row, col))
+        if not self.hasConflict(row, col):
+            return set()
 
-        return result
+        item = self._boards.item
+        num = item(row, col)
+        pos = {(row, col)}
+        for u in self._geometry.cellUnits[row * self.cols + col]:
+            if self._unitCounts[u][num] > 1:
+                for idx in self._geometry.units[u]:
+                    if item(idx) == num:
+                        pos.add(divmod(idx, self.cols))
+
+        return pos
+
+    @property
+    def notes(self):
+        return self._notes
+
+    def toggleNote(self, row, col, num):
+        self._notes[row, col] ^= 1 << (num - 1)
+        return int(self._notes[row, col])
+
+    def pruneNotes(self, row, col, num):
+        # Placing num at (row, col) clears the cell's own notes and num from
+        # the notes of its peers; returns the changed cells as
+        # (row, col, before, after).
+        idx = row * self.cols + col
+        notes = self._notes.reshape(-1)
+        bit = 1 << (num - 1)
+        changed = []
+        if notes[idx]:
+            changed.append((row, col, int(notes[idx]), 0))
+            notes[idx] = 0
+        for p in self._geometry.peers[idx]:
+            before = notes.item(p)
+            if before & bit:
+                notes[p] = before & ~bit
+                changed.append(divmod(p, self.cols) + (before, before & ~bit))
+
+        return changed
 
     def loadFomString(self, sudo):
-        s = sudo.split(', ')
-        self._level = self.parseSudokuLevel(s[0])
-        for i in range(self.rows):
-            for j in range(self.cols):
-                self[i, j] = int(s[i * self.cols + j + 1])
+        sudo = sudo.strip()
+        if "," not in sudo:
+            self.loadFromLine(sudo)
+            return
+
+        level, _, body = sudo.partition(", ")
+        # parsed wide so that out of range values fail the check instead of
+        # wrapping around into int8
+        cells = np.fromstring(body, dtype=np.int64, sep=",")
+        size = geometryOf(cells.size).size
+        if ((cells < 0) | (cells > size)).any():
+            raise ValueError(f"invalid sudoku string: {sudo!r}")
+
+        self._level = self.parseSudokuLevel(level)
+        self._setBoards(cells)
+
+    def loadFromLine(self, line, level=SudokuLevel.P):
+        # The one character per cell format of public datasets: '.' or '0' for
+        # empty cells, then 1-9 and A-P for the digits above nine.
+        cells = _CHAR_VALUES[np.frombuffer(line.strip().encode("ascii"), dtype=np.uint8)]
+        size = geometryOf(cells.size).size
+        if (cells > size).any():
+            raise ValueError(f"invalid sudoku line: {line!r}")
+
+        self._level = level
+        self._setBoards(cells)
 
     def parseSudokuLevel(self, s):
         for level in SudokuLevel:
@@ -174,22 +1419,32 @@ class Sudoku:
         return SudokuLevel.P
 
     def copy(self):
-        return Sudoku(repr(self))
+        sudo = Sudoku(variant=self._geometry)
+        sudo._level = self._level
+        sudo._setBoards(self._boards)
+        sudo._notes[:, :] = self._notes
+        return sudo
 
-    def __repr__(self):
-        sudo = [self._level.value]
-        for i in range(self.rows):
-            for j in range(self.cols):
-                sudo.append(f'{self[i, j]}')
+    def toLine(self, empty="."):
+        chars = empty + _DIGIT_CHARS[1:]
+        return "".join([chars[num] for num in self._boards.ravel().tolist()])
 
-        return ", ".join(sudo)
+    def __repr__(self):
+        return self._level.value + ", " + ", ".join(map(str, self._boards.ravel().tolist()))
 
     def __str__(self):
-        result = []
-        for i in range(Sudoku.rows):
-            result.append(",".join([f"{num}" for num in self[i, :]]))
+        return "\n".join(",".join(map(str, row)) for row in self._boards.tolist())
 
-        return "\n".join(result)
+    @staticmethod
+    def fromArray(boards, level=SudokuLevel.P):
+        sudo = Sudoku(boxes=geometryOf(np.size(boards)).boxes)
+        sudo._level = level
+        sudo._setBoards(boards)
+        return sudo
+
+    @property
+    def level(self):
+        return self._level
 
     @staticmethod
     def buildSudoku(level=SudokuLevel.P):
@@ -209,22 +1464,7 @@ class Sudoku:
 
 
 if __name__ == "__main__":
-    sudo = Sudoku()
-
-    sudo.loadFomString("P, "
-                       "0, 4, 0, 0, 0, 2, 0, 1, 9, "
-                       "0, 0, 0, 3, 5, 1, 0, 8, 6, "
-                       "3, 1, 0, 0, 9, 4, 7, 0, 0, "
-                       "0, 9, 4, 0, 0, 0, 0, 0, 7, "
-                       "0, 0, 0, 0, 0, 0, 0, 0, 0, "
-                       "2, 0, 0, 0, 0, 0, 8, 9, 0, "
-                       "0, 0, 9, 5, 2, 0, 0, 4, 1, "
-                       "4, 2, 0, 1, 6, 9, 0, 0, 0, "
-                       "1, 6, 0, 8, 0, 0, 0, 7, 0")
-    print(sudo)
-    sudo.solveWithCached()
-    print("\n")
-    print(sudo)
-    # # print(Sudoku.generateSudoku())
-    # print(sudo.findConflictedNumber(2, 2, 4))
-    # print(sudo.findAllowedNumber(0, 0))
\ No newline at end of file
+    import sys
+    from sudokupool import main
+
+    sys.exit(main())
@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+# -*- coding : utf-8 -*-
+
+import argparse
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from sudoku import SolveStats, Sudoku, SudokuLevel
+
+
+HARD_PUZZLES = {
+    "inkala-2012" : "800000000003600000070090200050007000000045700000100030001000068008500010090000400",
+    "ai-escargot" : "100007090030020008009600500005300900010080002600004000300000010040000007007000300",
+    "easter-monster" : "100000002090400050006000700050903000000070000000850040700000600030009080002000001",
+    "golden-nugget" : "000000039000001005003050800008090006070002000100400000009080050020000600400700000",
+    "platinum-blonde" : "000000012000000003002300400001800005060070800000009000008500000900040500470006000",
+}
+
+
+def buildPuzzleSets(count, seed):
+    rng = np.random.default_rng(seed)
+    sets = {level.value : [Sudoku.generateSudoku(level, rng=rng) for _ in range(count)] for level in SudokuLevel}
+    sets["hard"] = [Sudoku(line) for line in HARD_PUZZLES.values()]
+    return sets
+
+
+ENGINES = ["backtrack", "bitmask", "dlx"]
+
+
+def solveUntraced(engine):
+    def solve(sudo):
+        sudo.copy().solve(engine)
+    return solve
+
+
+def countNodes(engine, puzzles):
+    nodes = []
+    for sudo in puzzles:
+        stats = SolveStats(engine=engine)
+        sudo.copy().solve(engine, stats)
+        nodes.append(stats.nodes)
+    return sum(nodes) / len(nodes)
+
+
+def measure(fn, items):
+    items = list(items)
+    latencies = []
+    start = time.perf_counter()
+    for item in items:
+        t = time.perf_counter()
+        fn(item)
+        latencies.append(time.perf_counter() - t)
+    total = time.perf_counter() - start
+
+    # tracing slows the interpreter down, so memory gets its own pass
+    tracemalloc.start()
+    for item in items[:10]:
+        fn(item)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    latencies = np.array(latencies)
+    return {
+        "count" : len(latencies),
+        "rate" : len(latencies) / total if total > 0 else float("inf"),
+        "p50" : np.percentile(latencies, 50) * 1e3,
+        "p99" : np.percentile(latencies, 99) * 1e3,
+        "nodes" : None,
+        "peak" : peak / 1024,
+    }
+
+
+def formatRow(name, result):
+    nodes = "-" if result["nodes"] is None else f"{result['nodes']:.1f}"
+    return f"{name:<24}{result['count']:>6}{result['rate']:>12.1f}{result['p50']:>10.3f}" \
+           f"{result['p99']:>10.3f}{nodes:>10}{result['peak']:>10.1f}"
+
+
+def printHeader(title):
+    print(f"\n{title}")
+    print(f"{'case':<24}{'n':>6}{'puzzles/s':>12}{'p50 ms':>10}{'p99 ms':>10}{'nodes':>10}{'peak KiB':>10}")
+
+
+def runSolvers(sets, engines):
+    printHeader("solvers")
+    for name, puzzles in sets.items():
+        for engine in engines:
+            # timings come from the untraced path, node counts from a traced rerun
+            result = measure(solveUntraced(engine), puzzles)
+            result["nodes"] = countNodes(engine, puzzles)
+            print(formatRow(f"{name}/{engine}", result))
+
+
+def runOthers(sets, count, seed):
+    printHeader("generator and helpers")
+    rng = np.random.default_rng(seed)
+    for level in SudokuLevel:
+        print(formatRow(f"generate/{level.value}",
+                        measure(lambda _: Sudoku.generateSudoku(level, rng=rng), range(count))))
+
+    puzzles = [sudo for puzzles in sets.values() for sudo in puzzles]
+    lines = [repr(sudo) for sudo in puzzles]
+    print(formatRow("loadFomString", measure(Sudoku, lines)))
+    print(formatRow("findAllowedNumber",
+                    measure(lambda sudo: [sudo.findAllowedNumber(r, c) for r in range(9) for c in range(9)],
+                            puzzles)))
+    print(formatRow("findConflictedNumber",
+                    measure(lambda sudo: [sudo.findConflictedNumber(r, c, 5) for r in range(9) for c in range(9)],
+                            puzzles)))
+
+
+def parseArgs(argv):
+    parser = argparse.ArgumentParser(description="Benchmark the sudoku solvers and generator.")
+    parser.add_argument("-n", "--count", type=int, default=20, help="puzzles per level")
+    parser.add_argument("-s", "--seed", type=int, default=2021)
+    parser.add_argument("-e", "--engines", default="bitmask,dlx",
+                        help="comma separated solver engines to compare (backtrack is slow on hard puzzles)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parseArgs(argv)
+    engines = args.engines.split(",")
+    for engine in engines:
+        if engine not in ENGINES:
+            print(f"unknown engine: {engine}", file=sys.stderr)
+            return 2
+
+    sets = buildPuzzleSets(args.count, args.seed)
+    runSolvers(sets, engines)
+    runOthers(sets, args.count, args.seed)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,183 @@
+#!/usr/bin/env python
+# -*- coding : utf-8 -*-
+
+from PyQt5.QtWidgets import QWidget, QSizePolicy
+from PyQt5.QtGui import QPainter, QBrush, QColor, QFont, QRegion
+from PyQt5.QtCore import Qt, QEvent, QRect, QSize, pyqtSignal
+
+from sudoku import Sudoku, _DIGIT_CHARS
+
+
+class SudokuBoard(QWidget):
+    # The whole grid is one widget: cells are painted in paintEvent, a click
+    # is mapped to its cell arithmetically and a changed cell only repaints
+    # its own rect.
+    cellClicked = pyqtSignal(int, int)
+
+    # cell states: normal, filled in by the player, conflicted and given;
+    # the brushes are built once and shared by every paint
+    brushes = {
+        "n": QBrush(QColor(240, 240, 240)),
+        "f": QBrush(QColor(255, 255, 220)),
+        "c": QBrush(QColor(255, 200, 200)),
+        "g": QBrush(QColor(240, 240, 240)),
+    }
+    lineBrush = QBrush(QColor(0, 0, 0))
+    textColor = QColor(0, 0, 0)
+    notesColor = QColor(100, 100, 100)
+
+    # extra line width between boxes, in pixels
+    boxGap = 3
+
+    def __init__(self, parent=None, boxes=Sudoku.boxes):
+        super(SudokuBoard, self).__init__(parent)
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.setBoxes(boxes)
+
+    def setBoxes(self, boxes):
+        self._boxes = boxes
+        self._size = boxes * boxes
+        self._numbers = [[0] * self._size for _ in range(self._size)]
+        self._colors = [["n"] * self._size for _ in range(self._size)]
+        self._notes = [[0] * self._size for _ in range(self._size)]
+        self._layoutCells()
+        self.update()
+
+    def sizeHint(self):
+        return QSize(720, 720)
+
+    def minimumSizeHint(self):
+        side = self._size * 24 + (self._boxes + 1) * self.boxGap
+        return QSize(side, side)
+
+    def _layoutCells(self):
+        # square cells, the board centered in the widget
+        gaps = (self._boxes + 1) * self.boxGap
+        self._cell = max(1, (min(self.width(), self.height()) - gaps) // self._size)
+        self._band = self._boxes * self._cell + self.boxGap
+        side = self._boxes * self._band + self.boxGap
+        self._left = (self.width() - side) // 2
+        self._top = (self.height() - side) // 2
+        self._board = QRect(self._left, self._top, side, side)
+
+        self._font = QFont(self.font())
+        self._font.setPixelSize(max(1, self._cell * 11 // 20))
+        # pencil marks sit in a boxes x boxes grid inside the cell
+        self._notesFont = QFont(self.font())
+        self._notesFont.setBold(False)
+        self._notesFont.setPixelSize(max(1, self._cell * 11 // 20 // self._boxes))
+
+    def resizeEvent(self, event):
+        self._layoutCells()
+        super(SudokuBoard, self).resizeEvent(event)
+
+    def changeEvent(self, event):
+        if event.type() == QEvent.FontChange:
+            self._layoutCells()
+        super(SudokuBoard, self).changeEvent(event)
+
+    def cellRect(self, x, y):
+        # the cell interior, one pixel inside the thin grid lines
+        left = self._left + self.boxGap + (y // self._boxes) * self._band + (y % self._boxes) * self._cell
+        top = self._top + self.boxGap + (x // self._boxes) * self._band + (x % self._boxes) * self._cell
+        return QRect(left + 1, top + 1, self._cell - 1, self._cell - 1)
+
+    def _lineAt(self, offset):
+        # row or column under a pixel offset, -1 on a box line or outside
+        offset -= self.boxGap
+        box, inner = divmod(offset, self._band)
+        if offset < 0 or box >= self._boxes or inner >= self._boxes * self._cell:
+            return -1
+        return box * self._boxes + inner // self._cell
+
+    def cellAt(self, pos):
+        x = self._lineAt(pos.y() - self._top)
+        y = self._lineAt(pos.x() - self._left)
+        if x == -1 or y == -1:
+            return -1, -1
+        return x, y
+
+    def _lineRange(self, start, end):
+        # rows or columns of the boxes spanned by [start, end]
+        first = max(0, (start - self.boxGap) // self._band * self._boxes)
+        last = min(self._size - 1, (end - self.boxGap) // self._band * self._boxes + self._boxes - 1)
+        return range(first, last + 1)
+
+    def number(self, x, y):
+        return self._numbers[x][y]
+
+    def setCell(self, x, y, number, color="n"):
+        if self._numbers[x][y] == number and self._colors[x][y] == color:
+            return
+        self._numbers[x][y] = int(number)
+        self._colors[x][y] = color
+        self.update(self.cellRect(x, y))
+
+    def setCellColor(self, x, y, color="n"):
+        self.setCell(x, y, self._numbers[x][y], color)
+
+    def setNotes(self, x, y, notes):
+        if self._notes[x][y] == notes:
+            return
+        self._notes[x][y] = int(notes)
+        if self._numbers[x][y] == 0:
+            self.update(self.cellRect(x, y))
+
+    def setNumbers(self, numbers):
+        # loads a whole board, the clues as givens and without notes; only
+        # the cells that actually change are repainted, in one update
+        dirty = QRegion()
+        for x in range(self._size):
+            for y in range(self._size):
+                number = int(numbers[x][y])
+                color = "g" if number != 0 else "n"
+                if self._numbers[x][y] != number or self._colors[x][y] != color or self._notes[x][y]:
+                    self._numbers[x][y] = number
+                    self._colors[x][y] = color
+                    self._notes[x][y] = 0
+                    dirty += self.cellRect(x, y)
+        if not dirty.isEmpty():
+            self.update(dirty)
+
+    def paintEvent(self, event):
+        dirty = event.rect()
+        painter = QPainter(self)
+        painter.fillRect(dirty, self.palette().window())
+        painter.fillRect(dirty.intersected(self._board), self.lineBrush)
+
+        painter.setFont(self._font)
+        painter.setPen(self.textColor)
+        noted = []
+        for x in self._lineRange(dirty.top() - self._top, dirty.bottom() - self._top):
+            for y in self._lineRange(dirty.left() - self._left, dirty.right() - self._left):
+                rect = self.cellRect(x, y)
+                if not rect.intersects(dirty):
+                    continue
+                painter.fillRect(rect, self.brushes[self._colors[x][y]])
+                if self._numbers[x][y] != 0:
+                    painter.drawText(rect, Qt.AlignCenter, _DIGIT_CHARS[self._numbers[x][y]])
+                elif self._notes[x][y]:
+                    noted.append((rect, self._notes[x][y]))
+
+        # all the notes in a second pass, so the font and pen change once
+        painter.setFont(self._notesFont)
+        painter.setPen(self.notesColor)
+        step = self._cell // self._boxes
+        for rect, notes in noted:
+            for num in range(1, self._size + 1):
+                if notes >> (num - 1) & 1:
+                    row, col = divmod(num - 1, self._boxes)
+                    painter.drawText(QRect(rect.left() + col * step, rect.top() + row * step, step, step),
+                                     Qt.AlignCenter, _DIGIT_CHARS[num])
+
+        painter.end()
+
+    def mousePressEvent(self, event):
+        if event.button() != Qt.LeftButton:
+            super(SudokuBoard, self).mousePressEvent(event)
+            return
+
+        x, y = self.cellAt(event.pos())
+        if x != -1:
+            self.cellClicked.emit(x, y)
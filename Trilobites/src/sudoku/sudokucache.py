@@ -0,0 +1,227 @@
+#!/usr/bin/env python
+# -*- coding : utf-8 -*-
+
+import sqlite3
+from collections import OrderedDict, namedtuple
+from functools import lru_cache
+from itertools import permutations, product
+from typing import *
+
+import numpy as np
+
+from sudoku import Sudoku, SudokuLevel
+
+
+# Every row (or column) order that keeps the bands intact: a permutation of
+# the three bands combined with a permutation of the lines inside each band.
+_PERMS = list(permutations(range(3)))
+_LINE_ORDERS = np.array([[3 * bands[k] + inner[k][j] for k in range(3) for j in range(3)]
+                         for bands in _PERMS for inner in product(_PERMS, repeat=3)], dtype=np.intp)
+_PLACES = 10 ** np.arange(8, -1, -1, dtype=np.int64)
+
+# Maps a puzzle onto its canonical form: transpose first if asked, then take
+# the rows and columns in the given order and relabel the digits.
+Transform = namedtuple("Transform", ["transposed", "rows", "cols", "labels"])
+
+
+def _lineIds(grid):
+    # a class id per row of the grid, equal for rows with the same content
+    seen = {}
+    return tuple(seen.setdefault(row.tobytes(), len(seen)) for row in grid)
+
+
+def _distinct(lines, key):
+    # the lines whose key no earlier line in the list has
+    seen, kept = set(), []
+    for line in lines:
+        if key(line) not in seen:
+            seen.add(key(line))
+            kept.append(line)
+    return kept
+
+
+@lru_cache(maxsize=4096)
+def _nextRows(prefix, ids):
+    # Identical rows of a band, or identical bands, are interchangeable, so
+    # only the first of them is tried: that keeps the ties of sparse boards,
+    # e.g. their empty rows, from multiplying.
+    if len(prefix) % 3:
+        band = prefix[-1] // 3
+        return _distinct([r for r in range(3 * band, 3 * band + 3) if r not in prefix], ids.__getitem__)
+
+    used = {r // 3 for r in prefix}
+    bands = _distinct([band for band in range(3) if band not in used], lambda band: ids[3 * band : 3 * band + 3])
+    return [r for band in bands for r in _distinct(list(range(3 * band, 3 * band + 3)), ids.__getitem__)]
+
+
+def canonicalForm(boards):
+    # The lexicographically smallest row-major string among all transposes,
+    # band/stack and line permutations and digit relabelings of the board.
+    # Rows are fixed one at a time, keeping every partial transform that ties
+    # for the smallest prefix; a fixed transform is relabeled optimally by
+    # numbering the digits in order of first appearance.
+    boards = np.asarray(boards, dtype=np.int8)
+    if boards.shape != (9, 9):
+        raise ValueError("canonical forms are only defined for classic 9x9 boards")
+
+    grids = np.stack([boards, boards.T])
+
+    # The first row's digits are distinct and get fresh labels 1, 2, ... in
+    # order, so only its pattern of givens matters: that prefilters the
+    # 2 x 9 x 1296 first choices cheaply.
+    patterns = (grids[:, :, _LINE_ORDERS] != 0).astype(np.int64) @ (1 << np.arange(8, -1, -1))
+    low = patterns.min()
+    candidates = []
+    # column orders giving the same grid, and a transpose equal to the
+    # board, are interchangeable too and only searched once
+    ids = [_lineIds(grid) for grid in grids]
+    for t in range(1 if (grids[0] == grids[1]).all() else 2):
+        first = np.ones(len(_LINE_ORDERS), dtype=bool)
+        if len(set(ids[1 - t])) < 9:
+            first[:] = False
+            first[np.unique(np.array(ids[1 - t])[_LINE_ORDERS] @ _PLACES, return_index=True)[1]] = True
+        for r in _nextRows((), ids[t]):
+            perms = np.flatnonzero((patterns[t, r] == low) & first)
+            if len(perms):
+                candidates.append((t, (r,), perms, np.zeros((len(perms), 10), dtype=np.int8),
+                                   np.ones(len(perms), dtype=np.int8)))
+    rows = []
+
+    for step in range(9):
+        # every surviving partial transform extended by every allowed next
+        # row, relabeled in one batch
+        if step:
+            candidates = [(t, prefix + (r,), perms, labels, nexts)
+                          for t, prefix, perms, labels, nexts in groups for r in _nextRows(prefix, ids[t])]
+
+        sizes = [len(perms) for _, _, perms, _, _ in candidates]
+        ts = np.repeat([t for t, _, _, _, _ in candidates], sizes)
+        rs = np.repeat([prefix[-1] for _, prefix, _, _, _ in candidates], sizes)
+        perms = np.concatenate([c[2] for c in candidates])
+        labels = np.concatenate([c[3] for c in candidates])
+        nexts = np.concatenate([c[4] for c in candidates])
+        values = grids[ts[:, None], rs[:, None], _LINE_ORDERS[perms]]
+
+        at = np.arange(len(perms))
+        out = np.empty_like(values)
+        for j in range(9):
+            v = values[:, j]
+            fresh = (v != 0) & (labels[at, v] == 0)
+            labels[at[fresh], v[fresh]] = nexts[fresh]
+            nexts += fresh
+            out[:, j] = labels[at, v]
+
+        keys = out @ _PLACES
+        best = keys.min()
+        keep = keys == best
+        rows.append(best)
+
+        groups = []
+        start = 0
+        for (t, prefix, _, _, _), size in zip(candidates, sizes):
+            sel = np.flatnonzero(keep[start : start + size]) + start
+            if len(sel):
+                groups.append((t, prefix, perms[sel], labels[sel], nexts[sel]))
+            start += size
+
+    t, order, perms, labels, nexts = groups[0]
+    labels = labels[0].tolist()
+    # digits missing from the puzzle take the remaining labels in order
+    spare = iter(range(int(nexts[0]), 10))
+    for num in range(1, 10):
+        if labels[num] == 0:
+            labels[num] = next(spare)
+
+    line = "".join(f"{key:09d}" for key in rows)
+    return line, Transform(bool(t), order, tuple(_LINE_ORDERS[perms[0]].tolist()), tuple(labels))
+
+
+def applyTransform(boards, transform):
+    boards = np.asarray(boards, dtype=np.int8)
+    if transform.transposed:
+        boards = boards.T
+    return np.array(transform.labels, dtype=np.int8)[boards[np.ix_(transform.rows, transform.cols)]]
+
+
+def invertTransform(boards, transform):
+    inverse = np.argsort(transform.labels).astype(np.int8)
+    result = np.empty((9, 9), dtype=np.int8)
+    result[np.ix_(transform.rows, transform.cols)] = inverse[np.asarray(boards, dtype=np.int8)]
+    return result.T if transform.transposed else result
+
+
+class SolutionCache:
+    # Solutions and ratings keyed by canonical form in SQLite, so equivalent
+    # puzzles are solved and rated once. An LRU dict keyed by the puzzle as
+    # given answers exact repeats without canonicalizing again.
+    def __init__(self, path=":memory:", capacity=4096) -> None:
+        self.capacity = capacity
+        self._recent = OrderedDict()
+        self.hits = self.misses = 0
+        # several worker processes may share the file
+        self._db = sqlite3.connect(path, timeout=30)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute("CREATE TABLE IF NOT EXISTS solutions "
+                         "(canonical TEXT PRIMARY KEY, solution TEXT, level TEXT)")
+        self._db.commit()
+
+    def _remember(self, key, value):
+        self._recent[key] = value
+        self._recent.move_to_end(key)
+        if len(self._recent) > self.capacity:
+            self._recent.popitem(last=False)
+
+    def lookup(self, sudo : Sudoku, engine="bitmask"):
+        # Returns (solved copy, level) for the puzzle, or None when it has no
+        # solution; solving and rating only happen for an unseen class.
+        if not sudo._geometry.classic or sudo.rows != 9:
+            return self._solve(sudo, engine)
+
+        key = sudo.toLine("0")
+        if key in self._recent:
+            self.hits += 1
+            self._recent.move_to_end(key)
+            return self._answer(sudo, *self._recent[key])
+
+        canonical, transform = canonicalForm(sudo[:, :])
+        row = self._db.execute("SELECT solution, level FROM solutions WHERE canonical = ?",
+                               (canonical,)).fetchone()
+        if row is not None:
+            self.hits += 1
+            solution, level = row
+            if solution is not None:
+                solution = invertTransform(_digits(solution), transform)
+        else:
+            self.misses += 1
+            result = self._solve(sudo, engine)
+            solution, level = (None, None) if result is None else (result[0][:, :], result[1].value)
+            stored = None if solution is None else "".join(map(str, applyTransform(solution, transform).ravel()))
+            self._db.execute("INSERT OR REPLACE INTO solutions VALUES (?, ?, ?)", (canonical, stored, level))
+            self._db.commit()
+
+        self._remember(key, (solution, level))
+        return self._answer(sudo, solution, level)
+
+    @staticmethod
+    def _solve(sudo, engine):
+        solved = sudo.copy()
+        if not solved.solve(engine):
+            return None
+        return solved, sudo.rate() if sudo._geometry.classic else sudo.level
+
+    @staticmethod
+    def _answer(sudo, solution, level):
+        if solution is None:
+            return None
+        return Sudoku.fromArray(solution, SudokuLevel(level)), SudokuLevel(level)
+
+    def __len__(self):
+        return self._db.execute("SELECT COUNT(*) FROM solutions").fetchone()[0]
+
+    def close(self):
+        self._db.close()
+
+
+def _digits(line):
+    return np.frombuffer(line.encode("ascii"), dtype=np.uint8).reshape(9, 9) - ord("0")
@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# -*- coding : utf-8 -*-
+
+import os
+from typing import *
+
+import numpy as np
+
+from sudoku import Sudoku, SudokuLevel
+
+
+# A corpus file is a short header followed by fixed size records: one level
+# byte (the SudokuLevel value as ASCII) and the 81 cells packed two per byte,
+# high nibble first.
+CORPUS_MAGIC = b"SUDOKU\x01\x00"
+PACKED_CELLS = (Sudoku.rows * Sudoku.cols + 1) // 2
+RECORD = np.dtype([("level", np.uint8), ("cells", np.uint8, (PACKED_CELLS,))])
+
+_LEVEL_CODES = {level : ord(level.value) for level in SudokuLevel}
+_CODE_LEVELS = {code : level for level, code in _LEVEL_CODES.items()}
+
+
+def packBoards(boards, levels):
+    boards = np.asarray(boards, dtype=np.uint8).reshape(-1, Sudoku.rows * Sudoku.cols)
+    flat = np.zeros((len(boards), 2 * PACKED_CELLS), dtype=np.uint8)
+    flat[:, : Sudoku.rows * Sudoku.cols] = boards
+
+    records = np.empty(len(boards), dtype=RECORD)
+    records["cells"] = (flat[:, 0::2] << 4) | flat[:, 1::2]
+    records["level"] = [_LEVEL_CODES[level] for level in levels]
+    return records
+
+
+def unpackBoards(cells):
+    cells = np.asarray(cells, dtype=np.uint8).reshape(-1, PACKED_CELLS)
+    flat = np.empty((len(cells), 2 * PACKED_CELLS), dtype=np.int8)
+    flat[:, 0::2] = cells >> 4
+    flat[:, 1::2] = cells & 0x0F
+    return flat[:, : Sudoku.rows * Sudoku.cols].reshape(-1, Sudoku.rows, Sudoku.cols)
+
+
+def writeCorpus(path, sudokus : Iterable[Sudoku], chunkSize=65536, append=False):
+    count = 0
+    exists = append and os.path.exists(path) and os.path.getsize(path) > 0
+    with open(path, "ab" if exists else "wb") as f:
+        if not exists:
+            f.write(CORPUS_MAGIC)
+
+        chunk = []
+        for sudo in sudokus:
+            chunk.append(sudo)
+            if len(chunk) >= chunkSize:
+                count += _writeChunk(f, chunk)
+                chunk = []
+        if chunk:
+            count += _writeChunk(f, chunk)
+
+    return count
+
+
+def _writeChunk(f, chunk):
+    for sudo in chunk:
+        if sudo.rows != Sudoku.rows:
+            raise ValueError(f"corpus records hold {Sudoku.rows}x{Sudoku.cols} boards, got {sudo.rows}x{sudo.cols}")
+
+    boards = np.stack([sudo[:, :] for sudo in chunk])
+    f.write(packBoards(boards, [sudo.level for sudo in chunk]).tobytes())
+    return len(chunk)
+
+
+class PuzzleCorpus:
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            if f.read(len(CORPUS_MAGIC)) != CORPUS_MAGIC:
+                raise ValueError(f"{path} is not a sudoku corpus file")
+
+        size = os.path.getsize(path) - len(CORPUS_MAGIC)
+        if size % RECORD.itemsize:
+            raise ValueError(f"{path} is truncated")
+
+        if size:
+            self._records = np.memmap(path, dtype=RECORD, mode="r", offset=len(CORPUS_MAGIC))
+        else:
+            self._records = np.empty(0, dtype=RECORD)
+
+    def __len__(self):
+        return len(self._records)
+
+    def __getitem__(self, index):
+        record = self._records[index]
+        return Sudoku.fromArray(unpackBoards(record["cells"])[0], _CODE_LEVELS[int(record["level"])])
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    @property
+    def levels(self):
+        return self._records["level"]
+
+    def boards(self, start=0, stop=None):
+        return unpackBoards(self._records["cells"][start : stop])
+
+    def indexesOf(self, level):
+        return np.flatnonzero(self.levels == _LEVEL_CODES[level])
@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+# -*- coding : utf-8 -*-
+
+from collections import namedtuple
+from operator import index
+from typing import *
+
+import numpy as np
+
+
+# One player action on cell (x, y): the value before and after, plus the
+# pencil marks it changed as (x, y, before, after) tuples.
+Move = namedtuple("Move", ["x", "y", "before", "after", "marks"], defaults=((),))
+
+
+def parseMove(data, size=9):
+    # a Move from its saved [x, y, before, after, marks] form, checked to
+    # fit a size x size board; raises ValueError or TypeError otherwise
+    def cell(x, y):
+        x, y = index(x), index(y)
+        if not (0 <= x < size and 0 <= y < size):
+            raise ValueError(f"cell ({x}, {y}) outside a {size}x{size} board")
+        return x, y
+
+    def value(num, limit):
+        num = index(num)
+        if not 0 <= num <= limit:
+            raise ValueError(f"value {num} out of range")
+        return num
+
+    x, y, before, after, marks = data
+    marks = tuple(cell(mx, my) + (value(b, (1 << size) - 1), value(a, (1 << size) - 1))
+                  for mx, my, b, a in marks)
+    return Move(*cell(x, y), value(before, size), value(after, size), marks)
+
+
+class MoveHistory:
+    # Command log of the moves played from the origin puzzle, with an undo
+    # cursor. Every `snapshotEvery` moves the board and its pencil marks are
+    # kept as compact byte strings, so any position is rebuilt from the
+    # nearest snapshot plus fewer than `snapshotEvery` moves instead of
+    # replaying from the origin.
+    def __init__(self, origin, notes=None, snapshotEvery=32) -> None:
+        self.snapshotEvery = snapshotEvery
+        self.reset(origin, notes)
+
+    def reset(self, origin, notes=None):
+        origin = np.asarray(origin, dtype=np.int8)
+        notes = np.zeros(origin.shape, dtype=np.uint16) if notes is None else np.asarray(notes)
+        self._shape = origin.shape
+        self._notesType = notes.dtype
+        self._moves = []
+        self._cursor = 0
+        # _snapshots[k] is the position after k * snapshotEvery moves
+        self._snapshots = [(origin.tobytes(), notes.tobytes())]
+
+    def __len__(self):
+        return len(self._moves)
+
+    @property
+    def cursor(self):
+        return self._cursor
+
+    @property
+    def moves(self):
+        return self._moves
+
+    def canUndo(self):
+        return self._cursor > 0
+
+    def canRedo(self):
+        return self._cursor < len(self._moves)
+
+    def push(self, move : Move, board, notes):
+        # records a move played at the cursor, `board` and `notes` being the
+        # position after it; any undone moves past the cursor are dropped
+        del self._moves[self._cursor:]
+        del self._snapshots[self._cursor // self.snapshotEvery + 1:]
+
+        self._moves.append(move)
+        self._cursor += 1
+        if self._cursor % self.snapshotEvery == 0:
+            self._snapshots.append((np.asarray(board, dtype=np.int8).tobytes(),
+                                    np.asarray(notes, dtype=self._notesType).tobytes()))
+
+    def undo(self) -> Optional[Move]:
+        if not self.canUndo():
+            return None
+        self._cursor -= 1
+        return self._moves[self._cursor]
+
+    def redo(self) -> Optional[Move]:
+        if not self.canRedo():
+            return None
+        self._cursor += 1
+        return self._moves[self._cursor - 1]
+
+    def restore(self, moves : Iterable[Move]):
+        # replaces the log with moves played from the origin, rebuilding the
+        # snapshots; the cursor ends after the last move
+        board, notes = self.positionAt(0)
+        self._moves = []
+        self._cursor = 0
+        del self._snapshots[1:]
+        for move in moves:
+            board[move.x, move.y] = move.after
+            for x, y, _, after in move.marks:
+                notes[x, y] = after
+            self.push(move, board, notes)
+
+    def positionAt(self, index):
+        # (board, notes) after the first `index` moves
+        if not 0 <= index <= len(self._moves):
+            raise IndexError(f"no position {index} in a history of {len(self._moves)} moves")
+
+        k = min(index // self.snapshotEvery, len(self._snapshots) - 1)
+        board, notes = self._snapshots[k]
+        board = np.frombuffer(board, dtype=np.int8).reshape(self._shape).copy()
+        notes = np.frombuffer(notes, dtype=self._notesType).reshape(self._shape).copy()
+        for move in self._moves[k * self.snapshotEvery : index]:
+            board[move.x, move.y] = move.after
+            for x, y, _, after in move.marks:
+                notes[x, y] = after
+        return board, notes
+
+    def jump(self, index):
+        # moves the cursor to `index`, keeping the moves after it redoable,
+        # and returns the position there
+        position = self.positionAt(index)
+        self._cursor = index
+        return position
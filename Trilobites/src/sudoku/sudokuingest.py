@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+# -*- coding : utf-8 -*-
+
+import argparse
+import gzip
+import hashlib
+import os
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import *
+
+from sudoku import BitmaskSolver, Sudoku, SudokuLevel
+from sudokucache import canonicalForm
+from sudokucorpus import writeCorpus
+from sudokupool import chunked, imapOrdered, readPuzzles
+
+
+# Outcome of a single input line; only ACCEPTED puzzles reach the corpus.
+ACCEPTED = "accepted"
+MALFORMED = "malformed"
+INCONSISTENT = "inconsistent"
+UNSOLVABLE = "unsolvable"
+MULTIPLE = "multiple solutions"
+DUPLICATE = "duplicate"
+
+
+def openDump(path):
+    if path == "-":
+        return sys.stdin
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8")
+    return open(path, encoding="utf-8")
+
+
+def readDumps(paths):
+    for path in paths:
+        stream = openDump(path)
+        try:
+            yield from readPuzzles(stream)
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+
+
+def checkPuzzles(lines):
+    # Worker stage: parse, validate the givens, prove a unique solution, then
+    # canonicalize and rate. Returns (status, key, cells, level) per line with
+    # key a digest of the canonical form, so the dedupe set stays small.
+    results = []
+    for line in lines:
+        try:
+            sudo = Sudoku(line)
+        except (IndexError, ValueError):
+            results.append((MALFORMED, None, None, None))
+            continue
+
+        if sudo.rows != Sudoku.rows:
+            results.append((MALFORMED, None, None, None))
+            continue
+
+        solver = BitmaskSolver(sudo[:, :].ravel())
+        if not solver.consistent:
+            results.append((INCONSISTENT, None, None, None))
+            continue
+
+        solutions = solver.count(limit=2)
+        if solutions != 1:
+            results.append((UNSOLVABLE if solutions == 0 else MULTIPLE, None, None, None))
+            continue
+
+        canonical, _ = canonicalForm(sudo[:, :])
+        key = hashlib.blake2b(canonical.encode("ascii"), digest_size=16).digest()
+        level = Sudoku._rate(sudo[:, :].ravel(), solvable=True)
+        results.append((ACCEPTED, key, sudo.toLine("0"), level.value))
+
+    return results
+
+
+def ingest(executor, lines, chunkSize=256, window=8, counts : Counter = None):
+    # Yields the accepted, first-seen puzzles in input order. Only `window`
+    # chunks are in flight at a time, so memory is bounded by the dedupe set.
+    seen = set()
+    counts = Counter() if counts is None else counts
+    chunks = ((chunk,) for chunk in chunked(lines, chunkSize))
+    for status, key, cells, level in imapOrdered(executor, checkPuzzles, chunks, window):
+        if status == ACCEPTED and key in seen:
+            status = DUPLICATE
+        counts[status] += 1
+        if status != ACCEPTED:
+            continue
+
+        seen.add(key)
+        sudo = Sudoku()
+        sudo.loadFromLine(cells, SudokuLevel(level))
+        counts[sudo.level] += 1
+        yield sudo
+
+
+def parseArgs(argv):
+    parser = argparse.ArgumentParser(description="Import puzzle dumps into a packed sudoku corpus.")
+    parser.add_argument("inputs", nargs="+", help="text dumps, one puzzle per line, .gz is read compressed, "
+                                                  "'-' reads stdin")
+    parser.add_argument("-o", "--output", required=True, help="corpus file to write")
+    parser.add_argument("-a", "--append", action="store_true", help="append to an existing corpus")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="number of worker processes (default: cpu count)")
+    parser.add_argument("-c", "--chunksize", type=int, default=256,
+                        help="puzzles sent to a worker at a time")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parseArgs(argv)
+    jobs = args.jobs or os.cpu_count() or 1
+    counts = Counter()
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        puzzles = ingest(executor, readDumps(args.inputs), args.chunksize, 2 * jobs, counts)
+        written = writeCorpus(args.output, puzzles, chunkSize=4096, append=args.append)
+
+    for status in (ACCEPTED, DUPLICATE, MALFORMED, INCONSISTENT, UNSOLVABLE, MULTIPLE):
+        print(f"{status:<20}{counts[status]:>10}", file=sys.stderr)
+    for level in SudokuLevel:
+        print(f"level {level.value:<14}{counts[level]:>10}", file=sys.stderr)
+    print(f"{written} puzzles written to {args.output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,169 @@
+#!/usr/bin/env python
+# -*- coding : utf-8 -*-
+
+import argparse
+import csv
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import *
+
+from sudoku import SolveStats, Sudoku, SudokuLevel, spawnSeeds
+from sudokucache import SolutionCache
+
+
+# Outcome of a single input line, also the message for a failed one.
+SOLVED = "solved"
+MALFORMED = "malformed"
+UNSOLVABLE = "no solution"
+
+_caches = {}
+
+
+def workerCache(path):
+    # one connection per worker process, opened on first use
+    if path not in _caches:
+        _caches[path] = SolutionCache(path)
+    return _caches[path]
+
+
+def solvePuzzles(lines, engine="bitmask", traced=False, cachePath=None):
+    # statistics need real solves, so traced runs bypass the cache
+    cache = workerCache(cachePath) if cachePath and not traced else None
+    results = []
+    for line in lines:
+        stats = SolveStats(engine=engine) if traced else None
+        try:
+            sudo = Sudoku(line)
+        except (IndexError, ValueError):
+            results.append((MALFORMED, line, stats))
+            continue
+
+        if cache is not None:
+            answer = cache.lookup(sudo, engine)
+            if answer is None:
+                results.append((UNSOLVABLE, line, stats))
+            else:
+                results.append((SOLVED, repr(Sudoku.fromArray(answer[0][:, :], sudo.level)), stats))
+            continue
+
+        if sudo.solve(engine, stats):
+            results.append((SOLVED, repr(sudo), stats))
+        else:
+            results.append((UNSOLVABLE, line, stats))
+
+    return results
+
+
+def generatePuzzles(level, seeds, boxes=3, gridMethod="pattern"):
+    return [repr(Sudoku.generateSudoku(level, rng=seed, boxes=boxes, gridMethod=gridMethod)) for seed in seeds]
+
+
+def chunked(items, size):
+    it = iter(items)
+    while chunk := list(islice(it, size)):
+        yield chunk
+
+
+def imapOrdered(executor, fn, chunks, window):
+    # Keep at most `window` chunks in flight so large inputs are streamed,
+    # and yield the results chunk by chunk in submission order.
+    pending = deque()
+    for chunk in chunks:
+        pending.append(executor.submit(fn, *chunk))
+        if len(pending) >= window:
+            yield from pending.popleft().result()
+
+    while pending:
+        yield from pending.popleft().result()
+
+
+def generateBatch(executor, level, count, seed=None, boxes=3, chunkSize=8, window=8, gridMethod="pattern"):
+    # Parallel counterpart of Sudoku.generateBatch: every puzzle carries its
+    # own child seed, so the stream matches the sequential output exactly
+    # whatever the worker count or chunk size.
+    seeds = spawnSeeds(seed, count)
+    chunks = ((level, seeds[start : start + chunkSize], boxes, gridMethod) for start in range(0, count, chunkSize))
+    for text in imapOrdered(executor, generatePuzzles, chunks, window):
+        yield Sudoku(text)
+
+
+def readPuzzles(stream):
+    for line in stream:
+        line = line.strip()
+        if line:
+            yield line
+
+
+def parseArgs(argv):
+    parser = argparse.ArgumentParser(prog="python -m sudoku",
+                                     description="Solve or generate sudoku puzzles in batch.")
+    parser.add_argument("input", nargs="?", default="-",
+                        help="file with one puzzle per line, '-' reads stdin")
+    parser.add_argument("-g", "--generate", type=int, default=0, metavar="COUNT",
+                        help="generate COUNT puzzles instead of solving the input")
+    parser.add_argument("-l", "--level", default=SudokuLevel.M.value,
+                        choices=[level.value for level in SudokuLevel])
+    parser.add_argument("-b", "--boxes", type=int, default=3, choices=range(2, 6),
+                        help="box size of generated puzzles, 3 for the classic 9x9 board")
+    parser.add_argument("--grid", default="pattern", choices=["pattern", "solver"],
+                        help="build solution grids by shuffling a pattern (fast) or by randomized solving")
+    parser.add_argument("-s", "--seed", type=int, default=None,
+                        help="seed for reproducible generation, the output does not depend on --jobs")
+    parser.add_argument("-e", "--engine", default="bitmask", choices=["backtrack", "bitmask", "dlx"])
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="number of worker processes (default: cpu count)")
+    parser.add_argument("-c", "--chunksize", type=int, default=64,
+                        help="puzzles sent to a worker at a time")
+    parser.add_argument("--stats", metavar="FILE",
+                        help="write per-puzzle solver statistics as CSV to FILE")
+    parser.add_argument("--cache", metavar="FILE",
+                        help="SQLite file caching solutions by canonical puzzle form (ignored with --stats)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parseArgs(argv)
+    jobs = args.jobs or os.cpu_count() or 1
+    window = 2 * jobs
+    failed = 0
+    stream = sys.stdin
+    statsFile = statsWriter = None
+    if args.stats and not args.generate:
+        statsFile = open(args.stats, "w", encoding="utf-8", newline="")
+        statsWriter = csv.DictWriter(statsFile, fieldnames=SolveStats.FIELDS)
+        statsWriter.writeheader()
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        if args.generate > 0:
+            puzzles = generateBatch(executor, SudokuLevel(args.level), args.generate, args.seed,
+                                    args.boxes, args.chunksize, window, args.grid)
+            results = ((SOLVED, repr(sudo), None) for sudo in puzzles)
+        else:
+            stream = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+            chunks = ((chunk, args.engine, statsFile is not None, args.cache)
+                      for chunk in chunked(readPuzzles(stream), args.chunksize))
+            results = imapOrdered(executor, solvePuzzles, chunks, window)
+
+        for lineno, (status, text, stats) in enumerate(results, 1):
+            if status != SOLVED:
+                failed += 1
+                print(f"puzzle {lineno}: {status}", file=sys.stderr)
+            print(text)
+
+            if stats is not None and statsFile is not None:
+                stats.label = lineno
+                statsWriter.writerow(stats.asDict())
+
+        if stream is not sys.stdin:
+            stream.close()
+        if statsFile is not None:
+            statsFile.close()
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# -*- coding : utf-8 -*-
+
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import *
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+
+class SessionStore(QObject):
+    # Saved games, one small JSON file per session under ~/.sudoku/sessions,
+    # read once at startup and mirrored in memory afterwards. save() only
+    # arms a debounce timer; when it fires the session state is built once
+    # and written on a background thread, so a burst of moves costs one
+    # write and a click never waits on the disk.
+    sessionsChanged = pyqtSignal()
+
+    saveDelay = 1000
+    maxSessions = 20
+
+    def __init__(self, path=None, parent=None):
+        super(SessionStore, self).__init__(parent)
+        self._dir = path or os.path.join(os.path.expanduser("~"), ".sudoku", "sessions")
+        self._sessions = {}
+        self._pending = {}
+        self._writer = ThreadPoolExecutor(max_workers=1)
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self.flush)
+
+        self.load()
+
+    def _path(self, name):
+        return os.path.join(self._dir, name + ".json")
+
+    def load(self):
+        try:
+            files = [f for f in os.listdir(self._dir) if f.endswith(".json")]
+        except OSError:
+            return
+
+        for f in files:
+            try:
+                with open(os.path.join(self._dir, f), encoding="utf-8") as stream:
+                    state = json.load(stream)
+            except OSError:
+                continue
+            except ValueError:
+                state = None
+
+            # sessions() sorts on "saved" and the saved games list reads
+            # "origin", so a file without them is removed like a failed resume
+            if isinstance(state, dict) and isinstance(state.get("origin"), str) and \
+                    isinstance(state.get("saved"), (int, float)) and not isinstance(state["saved"], bool):
+                self._sessions[f[:-5]] = state
+            else:
+                self._writer.submit(self._remove, os.path.join(self._dir, f))
+
+    def sessions(self) -> List[Tuple[str, dict]]:
+        # (name, state) of every saved session, most recently saved first
+        return sorted(self._sessions.items(), key=lambda session: session[1].get("saved", 0), reverse=True)
+
+    def state(self, name) -> Optional[dict]:
+        return self._sessions.get(name)
+
+    def newName(self):
+        # a fresh session name; the oldest sessions beyond maxSessions go
+        for name, _ in self.sessions()[self.maxSessions - 1:]:
+            self.remove(name)
+        return time.strftime("%Y%m%d-%H%M%S-") + os.urandom(2).hex()
+
+    def save(self, name, state : Callable[[], dict]):
+        # state is only called when the debounce timer fires
+        self._pending[name] = state
+        self._timer.start(self.saveDelay)
+
+    def flush(self):
+        self._timer.stop()
+        pending, self._pending = self._pending, {}
+        for name, state in pending.items():
+            self._sessions[name] = dict(state(), saved=time.time())
+            self._writer.submit(self._write, self._path(name),
+                                json.dumps(self._sessions[name], separators=(",", ":")))
+        if pending:
+            self.sessionsChanged.emit()
+
+    def _write(self, path, text):
+        try:
+            os.makedirs(self._dir, exist_ok=True)
+            with open(path + ".tmp", "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(path + ".tmp", path)
+        except OSError:
+            pass
+
+    def remove(self, name):
+        self._pending.pop(name, None)
+        if self._sessions.pop(name, None) is not None:
+            self._writer.submit(self._remove, self._path(name))
+            self.sessionsChanged.emit()
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def close(self):
+        self.flush()
+        self._writer.shutdown(wait=True)
@@ -2,7 +2,7 @@
 
 # Form implementation generated from reading ui file 'sudokuui.ui'
 #
-# Created by: PyQt5 UI code generator 5.15.4
+# Created by: PyQt5 UI code generator 5.15.11
 #
 # WARNING: Any manual changes made to this file will be lost when pyuic5 is
 # run again.  Do not edit this file unless you know what you are doing.
@@ -25,1086 +25,20 @@ class Ui_sudokuMainWindow(object):
         sudokuMainWindow.setFont(font)
         self.gridLayout_14 = QtWidgets.QGridLayout(sudokuMainWindow)
         self.gridLayout_14.setObjectName("gridLayout_14")
-        self.frame = QtWidgets.QFrame(sudokuMainWindow)
-        self.frame.setFrameShape(QtWidgets.QFrame.WinPanel)
-        self.frame.setFrameShadow(QtWidgets.QFrame.Plain)
-        self.frame.setLineWidth(1)
-        self.frame.setObjectName("frame")
-        self.gridLayout_2 = QtWidgets.QGridLayout(self.frame)
-        self.gridLayout_2.setContentsMargins(0, 0, 0, 0)
-        self.gridLayout_2.setObjectName("gridLayout_2")
-        self.frame_2 = QtWidgets.QFrame(self.frame)
-        self.frame_2.setFrameShape(QtWidgets.QFrame.WinPanel)
-        self.frame_2.setFrameShadow(QtWidgets.QFrame.Plain)
-        self.frame_2.setLineWidth(1)
-        self.frame_2.setObjectName("frame_2")
-        self.gridLayout = QtWidgets.QGridLayout(self.frame_2)
-        self.gridLayout.setContentsMargins(5, 5, 5, 5)
-        self.gridLayout.setObjectName("gridLayout")
-        self.frame_3 = QtWidgets.QFrame(self.frame_2)
-        self.frame_3.setFrameShape(QtWidgets.QFrame.WinPanel)
-        self.frame_3.setFrameShadow(QtWidgets.QFrame.Plain)
-        self.frame_3.setObjectName("frame_3")
-        self.gridLayout_3 = QtWidgets.QGridLayout(self.frame_3)
-        self.gridLayout_3.setContentsMargins(2, 2, 2, 2)
-        self.gridLayout_3.setSpacing(0)
-        self.gridLayout_3.setObjectName("gridLayout_3")
-        self.frame_13 = QtWidgets.QFrame(self.frame_3)
-        self.frame_13.setFrameShape(QtWidgets.QFrame.WinPanel)
-        self.frame_13.setFrameShadow(QtWidgets.QFrame.Plain)
-        self.frame_13.setObjectName("frame_13")
-        self.gridLayout_13 = QtWidgets.QGridLayout(self.frame_13)
-        self.gridLayout_13.setContentsMargins(5, 5, 5, 5)
-        self.gridLayout_13.setSpacing(6)
-        self.gridLayout_13.setObjectName("gridLayout_13")
-        self.label7_1 = QtWidgets.QLabel(self.frame_13)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label7_1.setFont(font)
-        self.label7_1.setFrameShape(QtWidgets.QFrame.Box)
-        self.label7_1.setText("")
-        self.label7_1.setAlignment(QtCore.Qt.AlignCenter)
-        self.label7_1.setObjectName("label7_1")
-        self.gridLayout_13.addWidget(self.label7_1, 0, 0, 1, 1)
-        self.label7_2 = QtWidgets.QLabel(self.frame_13)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label7_2.setFont(font)
-        self.label7_2.setFrameShape(QtWidgets.QFrame.Box)
-        self.label7_2.setText("")
-        self.label7_2.setAlignment(QtCore.Qt.AlignCenter)
-        self.label7_2.setObjectName("label7_2")
-        self.gridLayout_13.addWidget(self.label7_2, 0, 1, 1, 1)
-        self.label7_3 = QtWidgets.QLabel(self.frame_13)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label7_3.setFont(font)
-        self.label7_3.setFrameShape(QtWidgets.QFrame.Box)
-        self.label7_3.setText("")
-        self.label7_3.setAlignment(QtCore.Qt.AlignCenter)
-        self.label7_3.setObjectName("label7_3")
-        self.gridLayout_13.addWidget(self.label7_3, 0, 2, 1, 1)
-        self.label8_1 = QtWidgets.QLabel(self.frame_13)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label8_1.setFont(font)
-        self.label8_1.setFrameShape(QtWidgets.QFrame.Box)
-        self.label8_1.setText("")
-        self.label8_1.setAlignment(QtCore.Qt.AlignCenter)
-        self.label8_1.setObjectName("label8_1")
-        self.gridLayout_13.addWidget(self.label8_1, 1, 0, 1, 1)
-        self.label8_2 = QtWidgets.QLabel(self.frame_13)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label8_2.setFont(font)
-        self.label8_2.setFrameShape(QtWidgets.QFrame.Box)
-        self.label8_2.setText("")
-        self.label8_2.setAlignment(QtCore.Qt.AlignCenter)
-        self.label8_2.setObjectName("label8_2")
-        self.gridLayout_13.addWidget(self.label8_2, 1, 1, 1, 1)
-        self.label8_3 = QtWidgets.QLabel(self.frame_13)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label8_3.setFont(font)
-        self.label8_3.setFrameShape(QtWidgets.QFrame.Box)
-        self.label8_3.setText("")
-        self.label8_3.setAlignment(QtCore.Qt.AlignCenter)
-        self.label8_3.setObjectName("label8_3")
-        self.gridLayout_13.addWidget(self.label8_3, 1, 2, 1, 1)
-        self.label9_1 = QtWidgets.QLabel(self.frame_13)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label9_1.setFont(font)
-        self.label9_1.setFrameShape(QtWidgets.QFrame.Box)
-        self.label9_1.setText("")
-        self.label9_1.setAlignment(QtCore.Qt.AlignCenter)
-        self.label9_1.setObjectName("label9_1")
-        self.gridLayout_13.addWidget(self.label9_1, 2, 0, 1, 1)
-        self.label9_2 = QtWidgets.QLabel(self.frame_13)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label9_2.setFont(font)
-        self.label9_2.setFrameShape(QtWidgets.QFrame.Box)
-        self.label9_2.setText("")
-        self.label9_2.setAlignment(QtCore.Qt.AlignCenter)
-        self.label9_2.setObjectName("label9_2")
-        self.gridLayout_13.addWidget(self.label9_2, 2, 1, 1, 1)
-        self.label9_3 = QtWidgets.QLabel(self.frame_13)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label9_3.setFont(font)
-        self.label9_3.setFrameShape(QtWidgets.QFrame.Box)
-        self.label9_3.setText("")
-        self.label9_3.setAlignment(QtCore.Qt.AlignCenter)
-        self.label9_3.setObjectName("label9_3")
-        self.gridLayout_13.addWidget(self.label9_3, 2, 2, 1, 1)
-        self.gridLayout_3.addWidget(self.frame_13, 3, 0, 1, 1)
-        self.frame_7 = QtWidgets.QFrame(self.frame_3)
-        self.frame_7.setFrameShape(QtWidgets.QFrame.WinPanel)
-        self.frame_7.setFrameShadow(QtWidgets.QFrame.Plain)
-        self.frame_7.setObjectName("frame_7")
-        self.gridLayout_7 = QtWidgets.QGridLayout(self.frame_7)
-        self.gridLayout_7.setContentsMargins(5, 5, 5, 5)
-        self.gridLayout_7.setSpacing(6)
-        self.gridLayout_7.setObjectName("gridLayout_7")
-        self.label1_7 = QtWidgets.QLabel(self.frame_7)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label1_7.setFont(font)
-        self.label1_7.setFrameShape(QtWidgets.QFrame.Box)
-        self.label1_7.setText("")
-        self.label1_7.setAlignment(QtCore.Qt.AlignCenter)
-        self.label1_7.setObjectName("label1_7")
-        self.gridLayout_7.addWidget(self.label1_7, 0, 0, 1, 1)
-        self.label1_8 = QtWidgets.QLabel(self.frame_7)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label1_8.setFont(font)
-        self.label1_8.setFrameShape(QtWidgets.QFrame.Box)
-        self.label1_8.setText("")
-        self.label1_8.setAlignment(QtCore.Qt.AlignCenter)
-        self.label1_8.setObjectName("label1_8")
-        self.gridLayout_7.addWidget(self.label1_8, 0, 1, 1, 1)
-        self.label1_9 = QtWidgets.QLabel(self.frame_7)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label1_9.setFont(font)
-        self.label1_9.setFrameShape(QtWidgets.QFrame.Box)
-        self.label1_9.setText("")
-        self.label1_9.setAlignment(QtCore.Qt.AlignCenter)
-        self.label1_9.setObjectName("label1_9")
-        self.gridLayout_7.addWidget(self.label1_9, 0, 2, 1, 1)
-        self.label2_7 = QtWidgets.QLabel(self.frame_7)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label2_7.setFont(font)
-        self.label2_7.setFrameShape(QtWidgets.QFrame.Box)
-        self.label2_7.setText("")
-        self.label2_7.setAlignment(QtCore.Qt.AlignCenter)
-        self.label2_7.setObjectName("label2_7")
-        self.gridLayout_7.addWidget(self.label2_7, 1, 0, 1, 1)
-        self.label2_8 = QtWidgets.QLabel(self.frame_7)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label2_8.setFont(font)
-        self.label2_8.setFrameShape(QtWidgets.QFrame.Box)
-        self.label2_8.setText("")
-        self.label2_8.setAlignment(QtCore.Qt.AlignCenter)
-        self.label2_8.setObjectName("label2_8")
-        self.gridLayout_7.addWidget(self.label2_8, 1, 1, 1, 1)
-        self.label2_9 = QtWidgets.QLabel(self.frame_7)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label2_9.setFont(font)
-        self.label2_9.setFrameShape(QtWidgets.QFrame.Box)
-        self.label2_9.setText("")
-        self.label2_9.setAlignment(QtCore.Qt.AlignCenter)
-        self.label2_9.setObjectName("label2_9")
-        self.gridLayout_7.addWidget(self.label2_9, 1, 2, 1, 1)
-        self.label3_7 = QtWidgets.QLabel(self.frame_7)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label3_7.setFont(font)
-        self.label3_7.setFrameShape(QtWidgets.QFrame.Box)
-        self.label3_7.setText("")
-        self.label3_7.setAlignment(QtCore.Qt.AlignCenter)
-        self.label3_7.setObjectName("label3_7")
-        self.gridLayout_7.addWidget(self.label3_7, 2, 0, 1, 1)
-        self.label3_8 = QtWidgets.QLabel(self.frame_7)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label3_8.setFont(font)
-        self.label3_8.setFrameShape(QtWidgets.QFrame.Box)
-        self.label3_8.setText("")
-        self.label3_8.setAlignment(QtCore.Qt.AlignCenter)
-        self.label3_8.setObjectName("label3_8")
-        self.gridLayout_7.addWidget(self.label3_8, 2, 1, 1, 1)
-        self.label3_9 = QtWidgets.QLabel(self.frame_7)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label3_9.setFont(font)
-        self.label3_9.setFrameShape(QtWidgets.QFrame.Box)
-        self.label3_9.setText("")
-        self.label3_9.setAlignment(QtCore.Qt.AlignCenter)
-        self.label3_9.setObjectName("label3_9")
-        self.gridLayout_7.addWidget(self.label3_9, 2, 2, 1, 1)
-        self.gridLayout_3.addWidget(self.frame_7, 0, 2, 1, 1)
-        self.frame_6 = QtWidgets.QFrame(self.frame_3)
-        self.frame_6.setFrameShape(QtWidgets.QFrame.WinPanel)
-        self.frame_6.setFrameShadow(QtWidgets.QFrame.Plain)
-        self.frame_6.setObjectName("frame_6")
-        self.gridLayout_6 = QtWidgets.QGridLayout(self.frame_6)
-        self.gridLayout_6.setContentsMargins(5, 5, 5, 5)
-        self.gridLayout_6.setSpacing(6)
-        self.gridLayout_6.setObjectName("gridLayout_6")
-        self.label1_4 = QtWidgets.QLabel(self.frame_6)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label1_4.setFont(font)
-        self.label1_4.setFrameShape(QtWidgets.QFrame.Box)
-        self.label1_4.setText("")
-        self.label1_4.setAlignment(QtCore.Qt.AlignCenter)
-        self.label1_4.setObjectName("label1_4")
-        self.gridLayout_6.addWidget(self.label1_4, 0, 0, 1, 1)
-        self.label1_5 = QtWidgets.QLabel(self.frame_6)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label1_5.setFont(font)
-        self.label1_5.setFrameShape(QtWidgets.QFrame.Box)
-        self.label1_5.setText("")
-        self.label1_5.setAlignment(QtCore.Qt.AlignCenter)
-        self.label1_5.setObjectName("label1_5")
-        self.gridLayout_6.addWidget(self.label1_5, 0, 1, 1, 1)
-        self.label1_6 = QtWidgets.QLabel(self.frame_6)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label1_6.setFont(font)
-        self.label1_6.setFrameShape(QtWidgets.QFrame.Box)
-        self.label1_6.setText("")
-        self.label1_6.setAlignment(QtCore.Qt.AlignCenter)
-        self.label1_6.setObjectName("label1_6")
-        self.gridLayout_6.addWidget(self.label1_6, 0, 2, 1, 1)
-        self.label2_4 = QtWidgets.QLabel(self.frame_6)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label2_4.setFont(font)
-        self.label2_4.setFrameShape(QtWidgets.QFrame.Box)
-        self.label2_4.setText("")
-        self.label2_4.setAlignment(QtCore.Qt.AlignCenter)
-        self.label2_4.setObjectName("label2_4")
-        self.gridLayout_6.addWidget(self.label2_4, 1, 0, 1, 1)
-        self.label2_5 = QtWidgets.QLabel(self.frame_6)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label2_5.setFont(font)
-        self.label2_5.setFrameShape(QtWidgets.QFrame.Box)
-        self.label2_5.setText("")
-        self.label2_5.setAlignment(QtCore.Qt.AlignCenter)
-        self.label2_5.setObjectName("label2_5")
-        self.gridLayout_6.addWidget(self.label2_5, 1, 1, 1, 1)
-        self.label2_6 = QtWidgets.QLabel(self.frame_6)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label2_6.setFont(font)
-        self.label2_6.setFrameShape(QtWidgets.QFrame.Box)
-        self.label2_6.setText("")
-        self.label2_6.setAlignment(QtCore.Qt.AlignCenter)
-        self.label2_6.setObjectName("label2_6")
-        self.gridLayout_6.addWidget(self.label2_6, 1, 2, 1, 1)
-        self.label3_4 = QtWidgets.QLabel(self.frame_6)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label3_4.setFont(font)
-        self.label3_4.setFrameShape(QtWidgets.QFrame.Box)
-        self.label3_4.setText("")
-        self.label3_4.setAlignment(QtCore.Qt.AlignCenter)
-        self.label3_4.setObjectName("label3_4")
-        self.gridLayout_6.addWidget(self.label3_4, 2, 0, 1, 1)
-        self.label3_5 = QtWidgets.QLabel(self.frame_6)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label3_5.setFont(font)
-        self.label3_5.setFrameShape(QtWidgets.QFrame.Box)
-        self.label3_5.setText("")
-        self.label3_5.setAlignment(QtCore.Qt.AlignCenter)
-        self.label3_5.setObjectName("label3_5")
-        self.gridLayout_6.addWidget(self.label3_5, 2, 1, 1, 1)
-        self.label3_6 = QtWidgets.QLabel(self.frame_6)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label3_6.setFont(font)
-        self.label3_6.setFrameShape(QtWidgets.QFrame.Box)
-        self.label3_6.setText("")
-        self.label3_6.setAlignment(QtCore.Qt.AlignCenter)
-        self.label3_6.setObjectName("label3_6")
-        self.gridLayout_6.addWidget(self.label3_6, 2, 2, 1, 1)
-        self.gridLayout_3.addWidget(self.frame_6, 0, 1, 1, 1)
-        self.frame_14 = QtWidgets.QFrame(self.frame_3)
-        self.frame_14.setFrameShape(QtWidgets.QFrame.WinPanel)
-        self.frame_14.setFrameShadow(QtWidgets.QFrame.Plain)
-        self.frame_14.setObjectName("frame_14")
-        self.gridLayout_11 = QtWidgets.QGridLayout(self.frame_14)
-        self.gridLayout_11.setContentsMargins(5, 5, 5, 5)
-        self.gridLayout_11.setSpacing(6)
-        self.gridLayout_11.setObjectName("gridLayout_11")
-        self.label7_7 = QtWidgets.QLabel(self.frame_14)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label7_7.setFont(font)
-        self.label7_7.setFrameShape(QtWidgets.QFrame.Box)
-        self.label7_7.setText("")
-        self.label7_7.setAlignment(QtCore.Qt.AlignCenter)
-        self.label7_7.setObjectName("label7_7")
-        self.gridLayout_11.addWidget(self.label7_7, 0, 0, 1, 1)
-        self.label7_8 = QtWidgets.QLabel(self.frame_14)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label7_8.setFont(font)
-        self.label7_8.setFrameShape(QtWidgets.QFrame.Box)
-        self.label7_8.setText("")
-        self.label7_8.setAlignment(QtCore.Qt.AlignCenter)
-        self.label7_8.setObjectName("label7_8")
-        self.gridLayout_11.addWidget(self.label7_8, 0, 1, 1, 1)
-        self.label7_9 = QtWidgets.QLabel(self.frame_14)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label7_9.setFont(font)
-        self.label7_9.setFrameShape(QtWidgets.QFrame.Box)
-        self.label7_9.setText("")
-        self.label7_9.setAlignment(QtCore.Qt.AlignCenter)
-        self.label7_9.setObjectName("label7_9")
-        self.gridLayout_11.addWidget(self.label7_9, 0, 2, 1, 1)
-        self.label8_7 = QtWidgets.QLabel(self.frame_14)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label8_7.setFont(font)
-        self.label8_7.setFrameShape(QtWidgets.QFrame.Box)
-        self.label8_7.setText("")
-        self.label8_7.setAlignment(QtCore.Qt.AlignCenter)
-        self.label8_7.setObjectName("label8_7")
-        self.gridLayout_11.addWidget(self.label8_7, 1, 0, 1, 1)
-        self.label8_8 = QtWidgets.QLabel(self.frame_14)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label8_8.setFont(font)
-        self.label8_8.setFrameShape(QtWidgets.QFrame.Box)
-        self.label8_8.setText("")
-        self.label8_8.setAlignment(QtCore.Qt.AlignCenter)
-        self.label8_8.setObjectName("label8_8")
-        self.gridLayout_11.addWidget(self.label8_8, 1, 1, 1, 1)
-        self.label8_9 = QtWidgets.QLabel(self.frame_14)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label8_9.setFont(font)
-        self.label8_9.setFrameShape(QtWidgets.QFrame.Box)
-        self.label8_9.setText("")
-        self.label8_9.setAlignment(QtCore.Qt.AlignCenter)
-        self.label8_9.setObjectName("label8_9")
-        self.gridLayout_11.addWidget(self.label8_9, 1, 2, 1, 1)
-        self.label9_7 = QtWidgets.QLabel(self.frame_14)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label9_7.setFont(font)
-        self.label9_7.setFrameShape(QtWidgets.QFrame.Box)
-        self.label9_7.setText("")
-        self.label9_7.setAlignment(QtCore.Qt.AlignCenter)
-        self.label9_7.setObjectName("label9_7")
-        self.gridLayout_11.addWidget(self.label9_7, 2, 0, 1, 1)
-        self.label9_8 = QtWidgets.QLabel(self.frame_14)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label9_8.setFont(font)
-        self.label9_8.setFrameShape(QtWidgets.QFrame.Box)
-        self.label9_8.setText("")
-        self.label9_8.setAlignment(QtCore.Qt.AlignCenter)
-        self.label9_8.setObjectName("label9_8")
-        self.gridLayout_11.addWidget(self.label9_8, 2, 1, 1, 1)
-        self.label9_9 = QtWidgets.QLabel(self.frame_14)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label9_9.setFont(font)
-        self.label9_9.setFrameShape(QtWidgets.QFrame.Box)
-        self.label9_9.setText("")
-        self.label9_9.setAlignment(QtCore.Qt.AlignCenter)
-        self.label9_9.setObjectName("label9_9")
-        self.gridLayout_11.addWidget(self.label9_9, 2, 2, 1, 1)
-        self.gridLayout_3.addWidget(self.frame_14, 3, 2, 1, 1)
-        self.frame_8 = QtWidgets.QFrame(self.frame_3)
-        self.frame_8.setFrameShape(QtWidgets.QFrame.WinPanel)
-        self.frame_8.setFrameShadow(QtWidgets.QFrame.Plain)
-        self.frame_8.setObjectName("frame_8")
-        self.gridLayout_8 = QtWidgets.QGridLayout(self.frame_8)
-        self.gridLayout_8.setContentsMargins(5, 5, 5, 5)
-        self.gridLayout_8.setSpacing(6)
-        self.gridLayout_8.setObjectName("gridLayout_8")
-        self.label4_1 = QtWidgets.QLabel(self.frame_8)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label4_1.setFont(font)
-        self.label4_1.setFrameShape(QtWidgets.QFrame.Box)
-        self.label4_1.setText("")
-        self.label4_1.setAlignment(QtCore.Qt.AlignCenter)
-        self.label4_1.setObjectName("label4_1")
-        self.gridLayout_8.addWidget(self.label4_1, 0, 0, 1, 1)
-        self.label4_2 = QtWidgets.QLabel(self.frame_8)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label4_2.setFont(font)
-        self.label4_2.setFrameShape(QtWidgets.QFrame.Box)
-        self.label4_2.setText("")
-        self.label4_2.setAlignment(QtCore.Qt.AlignCenter)
-        self.label4_2.setObjectName("label4_2")
-        self.gridLayout_8.addWidget(self.label4_2, 0, 1, 1, 1)
-        self.label4_3 = QtWidgets.QLabel(self.frame_8)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label4_3.setFont(font)
-        self.label4_3.setFrameShape(QtWidgets.QFrame.Box)
-        self.label4_3.setText("")
-        self.label4_3.setAlignment(QtCore.Qt.AlignCenter)
-        self.label4_3.setObjectName("label4_3")
-        self.gridLayout_8.addWidget(self.label4_3, 0, 2, 1, 1)
-        self.label5_1 = QtWidgets.QLabel(self.frame_8)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label5_1.setFont(font)
-        self.label5_1.setFrameShape(QtWidgets.QFrame.Box)
-        self.label5_1.setText("")
-        self.label5_1.setAlignment(QtCore.Qt.AlignCenter)
-        self.label5_1.setObjectName("label5_1")
-        self.gridLayout_8.addWidget(self.label5_1, 1, 0, 1, 1)
-        self.label5_2 = QtWidgets.QLabel(self.frame_8)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label5_2.setFont(font)
-        self.label5_2.setFrameShape(QtWidgets.QFrame.Box)
-        self.label5_2.setText("")
-        self.label5_2.setAlignment(QtCore.Qt.AlignCenter)
-        self.label5_2.setObjectName("label5_2")
-        self.gridLayout_8.addWidget(self.label5_2, 1, 1, 1, 1)
-        self.label5_3 = QtWidgets.QLabel(self.frame_8)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label5_3.setFont(font)
-        self.label5_3.setFrameShape(QtWidgets.QFrame.Box)
-        self.label5_3.setText("")
-        self.label5_3.setAlignment(QtCore.Qt.AlignCenter)
-        self.label5_3.setObjectName("label5_3")
-        self.gridLayout_8.addWidget(self.label5_3, 1, 2, 1, 1)
-        self.label6_1 = QtWidgets.QLabel(self.frame_8)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label6_1.setFont(font)
-        self.label6_1.setFrameShape(QtWidgets.QFrame.Box)
-        self.label6_1.setText("")
-        self.label6_1.setAlignment(QtCore.Qt.AlignCenter)
-        self.label6_1.setObjectName("label6_1")
-        self.gridLayout_8.addWidget(self.label6_1, 2, 0, 1, 1)
-        self.label6_2 = QtWidgets.QLabel(self.frame_8)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label6_2.setFont(font)
-        self.label6_2.setFrameShape(QtWidgets.QFrame.Box)
-        self.label6_2.setText("")
-        self.label6_2.setAlignment(QtCore.Qt.AlignCenter)
-        self.label6_2.setObjectName("label6_2")
-        self.gridLayout_8.addWidget(self.label6_2, 2, 1, 1, 1)
-        self.label6_3 = QtWidgets.QLabel(self.frame_8)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label6_3.setFont(font)
-        self.label6_3.setFrameShape(QtWidgets.QFrame.Box)
-        self.label6_3.setText("")
-        self.label6_3.setAlignment(QtCore.Qt.AlignCenter)
-        self.label6_3.setObjectName("label6_3")
-        self.gridLayout_8.addWidget(self.label6_3, 2, 2, 1, 1)
-        self.gridLayout_3.addWidget(self.frame_8, 2, 0, 1, 1)
-        self.frame_9 = QtWidgets.QFrame(self.frame_3)
-        self.frame_9.setFrameShape(QtWidgets.QFrame.WinPanel)
-        self.frame_9.setFrameShadow(QtWidgets.QFrame.Plain)
-        self.frame_9.setObjectName("frame_9")
-        self.gridLayout_9 = QtWidgets.QGridLayout(self.frame_9)
-        self.gridLayout_9.setContentsMargins(5, 5, 5, 5)
-        self.gridLayout_9.setSpacing(6)
-        self.gridLayout_9.setObjectName("gridLayout_9")
-        self.label4_4 = QtWidgets.QLabel(self.frame_9)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label4_4.setFont(font)
-        self.label4_4.setFrameShape(QtWidgets.QFrame.Box)
-        self.label4_4.setText("")
-        self.label4_4.setAlignment(QtCore.Qt.AlignCenter)
-        self.label4_4.setObjectName("label4_4")
-        self.gridLayout_9.addWidget(self.label4_4, 0, 0, 1, 1)
-        self.label4_5 = QtWidgets.QLabel(self.frame_9)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label4_5.setFont(font)
-        self.label4_5.setFrameShape(QtWidgets.QFrame.Box)
-        self.label4_5.setText("")
-        self.label4_5.setAlignment(QtCore.Qt.AlignCenter)
-        self.label4_5.setObjectName("label4_5")
-        self.gridLayout_9.addWidget(self.label4_5, 0, 1, 1, 1)
-        self.label4_6 = QtWidgets.QLabel(self.frame_9)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label4_6.setFont(font)
-        self.label4_6.setFrameShape(QtWidgets.QFrame.Box)
-        self.label4_6.setText("")
-        self.label4_6.setAlignment(QtCore.Qt.AlignCenter)
-        self.label4_6.setObjectName("label4_6")
-        self.gridLayout_9.addWidget(self.label4_6, 0, 2, 1, 1)
-        self.label5_4 = QtWidgets.QLabel(self.frame_9)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label5_4.setFont(font)
-        self.label5_4.setFrameShape(QtWidgets.QFrame.Box)
-        self.label5_4.setText("")
-        self.label5_4.setAlignment(QtCore.Qt.AlignCenter)
-        self.label5_4.setObjectName("label5_4")
-        self.gridLayout_9.addWidget(self.label5_4, 1, 0, 1, 1)
-        self.label5_5 = QtWidgets.QLabel(self.frame_9)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label5_5.setFont(font)
-        self.label5_5.setFrameShape(QtWidgets.QFrame.Box)
-        self.label5_5.setText("")
-        self.label5_5.setAlignment(QtCore.Qt.AlignCenter)
-        self.label5_5.setObjectName("label5_5")
-        self.gridLayout_9.addWidget(self.label5_5, 1, 1, 1, 1)
-        self.label5_6 = QtWidgets.QLabel(self.frame_9)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label5_6.setFont(font)
-        self.label5_6.setFrameShape(QtWidgets.QFrame.Box)
-        self.label5_6.setText("")
-        self.label5_6.setAlignment(QtCore.Qt.AlignCenter)
-        self.label5_6.setObjectName("label5_6")
-        self.gridLayout_9.addWidget(self.label5_6, 1, 2, 1, 1)
-        self.label6_4 = QtWidgets.QLabel(self.frame_9)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label6_4.setFont(font)
-        self.label6_4.setFrameShape(QtWidgets.QFrame.Box)
-        self.label6_4.setText("")
-        self.label6_4.setAlignment(QtCore.Qt.AlignCenter)
-        self.label6_4.setObjectName("label6_4")
-        self.gridLayout_9.addWidget(self.label6_4, 2, 0, 1, 1)
-        self.label6_5 = QtWidgets.QLabel(self.frame_9)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label6_5.setFont(font)
-        self.label6_5.setFrameShape(QtWidgets.QFrame.Box)
-        self.label6_5.setText("")
-        self.label6_5.setAlignment(QtCore.Qt.AlignCenter)
-        self.label6_5.setObjectName("label6_5")
-        self.gridLayout_9.addWidget(self.label6_5, 2, 1, 1, 1)
-        self.label6_6 = QtWidgets.QLabel(self.frame_9)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label6_6.setFont(font)
-        self.label6_6.setFrameShape(QtWidgets.QFrame.Box)
-        self.label6_6.setText("")
-        self.label6_6.setAlignment(QtCore.Qt.AlignCenter)
-        self.label6_6.setObjectName("label6_6")
-        self.gridLayout_9.addWidget(self.label6_6, 2, 2, 1, 1)
-        self.gridLayout_3.addWidget(self.frame_9, 2, 1, 1, 1)
-        self.frame_10 = QtWidgets.QFrame(self.frame_3)
-        self.frame_10.setFrameShape(QtWidgets.QFrame.WinPanel)
-        self.frame_10.setFrameShadow(QtWidgets.QFrame.Plain)
-        self.frame_10.setObjectName("frame_10")
-        self.gridLayout_10 = QtWidgets.QGridLayout(self.frame_10)
-        self.gridLayout_10.setContentsMargins(5, 5, 5, 5)
-        self.gridLayout_10.setSpacing(6)
-        self.gridLayout_10.setObjectName("gridLayout_10")
-        self.label4_7 = QtWidgets.QLabel(self.frame_10)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label4_7.setFont(font)
-        self.label4_7.setFrameShape(QtWidgets.QFrame.Box)
-        self.label4_7.setText("")
-        self.label4_7.setAlignment(QtCore.Qt.AlignCenter)
-        self.label4_7.setObjectName("label4_7")
-        self.gridLayout_10.addWidget(self.label4_7, 0, 0, 1, 1)
-        self.label4_8 = QtWidgets.QLabel(self.frame_10)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label4_8.setFont(font)
-        self.label4_8.setFrameShape(QtWidgets.QFrame.Box)
-        self.label4_8.setText("")
-        self.label4_8.setAlignment(QtCore.Qt.AlignCenter)
-        self.label4_8.setObjectName("label4_8")
-        self.gridLayout_10.addWidget(self.label4_8, 0, 1, 1, 1)
-        self.label4_9 = QtWidgets.QLabel(self.frame_10)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label4_9.setFont(font)
-        self.label4_9.setFrameShape(QtWidgets.QFrame.Box)
-        self.label4_9.setText("")
-        self.label4_9.setAlignment(QtCore.Qt.AlignCenter)
-        self.label4_9.setObjectName("label4_9")
-        self.gridLayout_10.addWidget(self.label4_9, 0, 2, 1, 1)
-        self.label5_7 = QtWidgets.QLabel(self.frame_10)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label5_7.setFont(font)
-        self.label5_7.setFrameShape(QtWidgets.QFrame.Box)
-        self.label5_7.setText("")
-        self.label5_7.setAlignment(QtCore.Qt.AlignCenter)
-        self.label5_7.setObjectName("label5_7")
-        self.gridLayout_10.addWidget(self.label5_7, 1, 0, 1, 1)
-        self.label5_8 = QtWidgets.QLabel(self.frame_10)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label5_8.setFont(font)
-        self.label5_8.setFrameShape(QtWidgets.QFrame.Box)
-        self.label5_8.setText("")
-        self.label5_8.setAlignment(QtCore.Qt.AlignCenter)
-        self.label5_8.setObjectName("label5_8")
-        self.gridLayout_10.addWidget(self.label5_8, 1, 1, 1, 1)
-        self.label5_9 = QtWidgets.QLabel(self.frame_10)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label5_9.setFont(font)
-        self.label5_9.setFrameShape(QtWidgets.QFrame.Box)
-        self.label5_9.setText("")
-        self.label5_9.setAlignment(QtCore.Qt.AlignCenter)
-        self.label5_9.setObjectName("label5_9")
-        self.gridLayout_10.addWidget(self.label5_9, 1, 2, 1, 1)
-        self.label6_7 = QtWidgets.QLabel(self.frame_10)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label6_7.setFont(font)
-        self.label6_7.setFrameShape(QtWidgets.QFrame.Box)
-        self.label6_7.setText("")
-        self.label6_7.setAlignment(QtCore.Qt.AlignCenter)
-        self.label6_7.setObjectName("label6_7")
-        self.gridLayout_10.addWidget(self.label6_7, 2, 0, 1, 1)
-        self.label6_8 = QtWidgets.QLabel(self.frame_10)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label6_8.setFont(font)
-        self.label6_8.setFrameShape(QtWidgets.QFrame.Box)
-        self.label6_8.setText("")
-        self.label6_8.setAlignment(QtCore.Qt.AlignCenter)
-        self.label6_8.setObjectName("label6_8")
-        self.gridLayout_10.addWidget(self.label6_8, 2, 1, 1, 1)
-        self.label6_9 = QtWidgets.QLabel(self.frame_10)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label6_9.setFont(font)
-        self.label6_9.setFrameShape(QtWidgets.QFrame.Box)
-        self.label6_9.setText("")
-        self.label6_9.setAlignment(QtCore.Qt.AlignCenter)
-        self.label6_9.setObjectName("label6_9")
-        self.gridLayout_10.addWidget(self.label6_9, 2, 2, 1, 1)
-        self.gridLayout_3.addWidget(self.frame_10, 2, 2, 1, 1)
-        self.frame_11 = QtWidgets.QFrame(self.frame_3)
-        self.frame_11.setFrameShape(QtWidgets.QFrame.WinPanel)
-        self.frame_11.setFrameShadow(QtWidgets.QFrame.Plain)
-        self.frame_11.setObjectName("frame_11")
-        self.gridLayout_12 = QtWidgets.QGridLayout(self.frame_11)
-        self.gridLayout_12.setContentsMargins(5, 5, 5, 5)
-        self.gridLayout_12.setSpacing(6)
-        self.gridLayout_12.setObjectName("gridLayout_12")
-        self.label7_4 = QtWidgets.QLabel(self.frame_11)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label7_4.setFont(font)
-        self.label7_4.setFrameShape(QtWidgets.QFrame.Box)
-        self.label7_4.setText("")
-        self.label7_4.setAlignment(QtCore.Qt.AlignCenter)
-        self.label7_4.setObjectName("label7_4")
-        self.gridLayout_12.addWidget(self.label7_4, 0, 0, 1, 1)
-        self.label7_5 = QtWidgets.QLabel(self.frame_11)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label7_5.setFont(font)
-        self.label7_5.setFrameShape(QtWidgets.QFrame.Box)
-        self.label7_5.setText("")
-        self.label7_5.setAlignment(QtCore.Qt.AlignCenter)
-        self.label7_5.setObjectName("label7_5")
-        self.gridLayout_12.addWidget(self.label7_5, 0, 1, 1, 1)
-        self.label7_6 = QtWidgets.QLabel(self.frame_11)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label7_6.setFont(font)
-        self.label7_6.setFrameShape(QtWidgets.QFrame.Box)
-        self.label7_6.setText("")
-        self.label7_6.setAlignment(QtCore.Qt.AlignCenter)
-        self.label7_6.setObjectName("label7_6")
-        self.gridLayout_12.addWidget(self.label7_6, 0, 2, 1, 1)
-        self.label8_4 = QtWidgets.QLabel(self.frame_11)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label8_4.setFont(font)
-        self.label8_4.setFrameShape(QtWidgets.QFrame.Box)
-        self.label8_4.setText("")
-        self.label8_4.setAlignment(QtCore.Qt.AlignCenter)
-        self.label8_4.setObjectName("label8_4")
-        self.gridLayout_12.addWidget(self.label8_4, 1, 0, 1, 1)
-        self.label8_5 = QtWidgets.QLabel(self.frame_11)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label8_5.setFont(font)
-        self.label8_5.setFrameShape(QtWidgets.QFrame.Box)
-        self.label8_5.setText("")
-        self.label8_5.setAlignment(QtCore.Qt.AlignCenter)
-        self.label8_5.setObjectName("label8_5")
-        self.gridLayout_12.addWidget(self.label8_5, 1, 1, 1, 1)
-        self.label8_6 = QtWidgets.QLabel(self.frame_11)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label8_6.setFont(font)
-        self.label8_6.setFrameShape(QtWidgets.QFrame.Box)
-        self.label8_6.setText("")
-        self.label8_6.setAlignment(QtCore.Qt.AlignCenter)
-        self.label8_6.setObjectName("label8_6")
-        self.gridLayout_12.addWidget(self.label8_6, 1, 2, 1, 1)
-        self.label9_4 = QtWidgets.QLabel(self.frame_11)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label9_4.setFont(font)
-        self.label9_4.setFrameShape(QtWidgets.QFrame.Box)
-        self.label9_4.setText("")
-        self.label9_4.setAlignment(QtCore.Qt.AlignCenter)
-        self.label9_4.setObjectName("label9_4")
-        self.gridLayout_12.addWidget(self.label9_4, 2, 0, 1, 1)
-        self.label9_5 = QtWidgets.QLabel(self.frame_11)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label9_5.setFont(font)
-        self.label9_5.setFrameShape(QtWidgets.QFrame.Box)
-        self.label9_5.setText("")
-        self.label9_5.setAlignment(QtCore.Qt.AlignCenter)
-        self.label9_5.setObjectName("label9_5")
-        self.gridLayout_12.addWidget(self.label9_5, 2, 1, 1, 1)
-        self.label9_6 = QtWidgets.QLabel(self.frame_11)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label9_6.setFont(font)
-        self.label9_6.setFrameShape(QtWidgets.QFrame.Box)
-        self.label9_6.setText("")
-        self.label9_6.setAlignment(QtCore.Qt.AlignCenter)
-        self.label9_6.setObjectName("label9_6")
-        self.gridLayout_12.addWidget(self.label9_6, 2, 2, 1, 1)
-        self.gridLayout_3.addWidget(self.frame_11, 3, 1, 1, 1)
-        self.frame_4 = QtWidgets.QFrame(self.frame_3)
-        self.frame_4.setFrameShape(QtWidgets.QFrame.WinPanel)
-        self.frame_4.setFrameShadow(QtWidgets.QFrame.Plain)
-        self.frame_4.setObjectName("frame_4")
-        self.gridLayout_5 = QtWidgets.QGridLayout(self.frame_4)
-        self.gridLayout_5.setContentsMargins(5, 5, 5, 5)
-        self.gridLayout_5.setSpacing(6)
-        self.gridLayout_5.setObjectName("gridLayout_5")
-        self.label1_1 = QtWidgets.QLabel(self.frame_4)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label1_1.setFont(font)
-        self.label1_1.setFrameShape(QtWidgets.QFrame.Box)
-        self.label1_1.setText("")
-        self.label1_1.setAlignment(QtCore.Qt.AlignCenter)
-        self.label1_1.setObjectName("label1_1")
-        self.gridLayout_5.addWidget(self.label1_1, 0, 0, 1, 1)
-        self.label1_2 = QtWidgets.QLabel(self.frame_4)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label1_2.setFont(font)
-        self.label1_2.setFrameShape(QtWidgets.QFrame.Box)
-        self.label1_2.setText("")
-        self.label1_2.setAlignment(QtCore.Qt.AlignCenter)
-        self.label1_2.setObjectName("label1_2")
-        self.gridLayout_5.addWidget(self.label1_2, 0, 1, 1, 1)
-        self.label1_3 = QtWidgets.QLabel(self.frame_4)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label1_3.setFont(font)
-        self.label1_3.setFrameShape(QtWidgets.QFrame.Box)
-        self.label1_3.setText("")
-        self.label1_3.setAlignment(QtCore.Qt.AlignCenter)
-        self.label1_3.setObjectName("label1_3")
-        self.gridLayout_5.addWidget(self.label1_3, 0, 2, 1, 1)
-        self.label2_1 = QtWidgets.QLabel(self.frame_4)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label2_1.setFont(font)
-        self.label2_1.setFrameShape(QtWidgets.QFrame.Box)
-        self.label2_1.setText("")
-        self.label2_1.setAlignment(QtCore.Qt.AlignCenter)
-        self.label2_1.setObjectName("label2_1")
-        self.gridLayout_5.addWidget(self.label2_1, 1, 0, 1, 1)
-        self.label2_2 = QtWidgets.QLabel(self.frame_4)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label2_2.setFont(font)
-        self.label2_2.setFrameShape(QtWidgets.QFrame.Box)
-        self.label2_2.setText("")
-        self.label2_2.setAlignment(QtCore.Qt.AlignCenter)
-        self.label2_2.setObjectName("label2_2")
-        self.gridLayout_5.addWidget(self.label2_2, 1, 1, 1, 1)
-        self.label2_3 = QtWidgets.QLabel(self.frame_4)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label2_3.setFont(font)
-        self.label2_3.setFrameShape(QtWidgets.QFrame.Box)
-        self.label2_3.setText("")
-        self.label2_3.setAlignment(QtCore.Qt.AlignCenter)
-        self.label2_3.setObjectName("label2_3")
-        self.gridLayout_5.addWidget(self.label2_3, 1, 2, 1, 1)
-        self.label3_1 = QtWidgets.QLabel(self.frame_4)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label3_1.setFont(font)
-        self.label3_1.setFrameShape(QtWidgets.QFrame.Box)
-        self.label3_1.setText("")
-        self.label3_1.setAlignment(QtCore.Qt.AlignCenter)
-        self.label3_1.setObjectName("label3_1")
-        self.gridLayout_5.addWidget(self.label3_1, 2, 0, 1, 1)
-        self.label3_2 = QtWidgets.QLabel(self.frame_4)
-        font = QtGui.QFont()
-        font.setFamily("微软雅黑")
-        font.setPointSize(16)
-        font.setBold(True)
-        font.setWeight(75)
-        self.label3_2.setFont(font)
-        self.label3_2.setFrameShape(QtWidgets.QFrame.Box)
-        self.label3_2.setText("")
-        self.label3_2.setAlignment(QtCore.Qt.AlignCenter)
-        self.label3_2.setObjectName("label3_2")
-        self.gridLayout_5.addWidget(self.label3_2, 2, 1, 1, 1)
-        self.label3_3 = QtWidgets.QLabel(self.frame_4)
+        self.sudokuBoard = SudokuBoard(sudokuMainWindow)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.sudokuBoard.sizePolicy().hasHeightForWidth())
+        self.sudokuBoard.setSizePolicy(sizePolicy)
         font = QtGui.QFont()
         font.setFamily("微软雅黑")
         font.setPointSize(16)
         font.setBold(True)
         font.setWeight(75)
-        self.label3_3.setFont(font)
-        self.label3_3.setFrameShape(QtWidgets.QFrame.Box)
-        self.label3_3.setText("")
-        self.label3_3.setAlignment(QtCore.Qt.AlignCenter)
-        self.label3_3.setObjectName("label3_3")
-        self.gridLayout_5.addWidget(self.label3_3, 2, 2, 1, 1)
-        self.gridLayout_3.addWidget(self.frame_4, 0, 0, 1, 1)
-        self.gridLayout.addWidget(self.frame_3, 0, 0, 1, 1)
-        self.gridLayout_2.addWidget(self.frame_2, 0, 0, 1, 1)
-        self.gridLayout_14.addWidget(self.frame, 0, 0, 1, 1)
+        self.sudokuBoard.setFont(font)
+        self.sudokuBoard.setObjectName("sudokuBoard")
+        self.gridLayout_14.addWidget(self.sudokuBoard, 0, 0, 1, 1)
         self.frame_5 = QtWidgets.QFrame(sudokuMainWindow)
         sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Preferred)
         sizePolicy.setHorizontalStretch(0)
@@ -1224,6 +158,25 @@ class Ui_sudokuMainWindow(object):
         self.gameLevelComboBox.addItem("")
         self.gameLevelComboBox.addItem("")
         self.formLayout.setWidget(0, QtWidgets.QFormLayout.FieldRole, self.gameLevelComboBox)
+        self.label_2 = QtWidgets.QLabel(self.frame_5)
+        font = QtGui.QFont()
+        font.setPointSize(16)
+        self.label_2.setFont(font)
+        self.label_2.setObjectName("label_2")
+        self.formLayout.setWidget(1, QtWidgets.QFormLayout.LabelRole, self.label_2)
+        self.savedGamesComboBox = QtWidgets.QComboBox(self.frame_5)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.savedGamesComboBox.sizePolicy().hasHeightForWidth())
+        self.savedGamesComboBox.setSizePolicy(sizePolicy)
+        font = QtGui.QFont()
+        font.setPointSize(16)
+        self.savedGamesComboBox.setFont(font)
+        self.savedGamesComboBox.setSizeAdjustPolicy(QtWidgets.QComboBox.AdjustToMinimumContentsLengthWithIcon)
+        self.savedGamesComboBox.setMinimumContentsLength(6)
+        self.savedGamesComboBox.setObjectName("savedGamesComboBox")
+        self.formLayout.setWidget(1, QtWidgets.QFormLayout.FieldRole, self.savedGamesComboBox)
         self.verticalLayout.addLayout(self.formLayout)
         spacerItem1 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
         self.verticalLayout.addItem(spacerItem1)
@@ -1315,6 +268,13 @@ class Ui_sudokuMainWindow(object):
         self.numberButton1.setObjectName("numberButton1")
         self.gridLayout_4.addWidget(self.numberButton1, 0, 0, 1, 1)
         self.verticalLayout.addWidget(self.groupBox)
+        self.notesButton = QtWidgets.QPushButton(self.frame_5)
+        font = QtGui.QFont()
+        font.setPointSize(16)
+        self.notesButton.setFont(font)
+        self.notesButton.setCheckable(True)
+        self.notesButton.setObjectName("notesButton")
+        self.verticalLayout.addWidget(self.notesButton)
         spacerItem2 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
         self.verticalLayout.addItem(spacerItem2)
         self.newGameButton = QtWidgets.QPushButton(self.frame_5)
@@ -1335,6 +295,18 @@ class Ui_sudokuMainWindow(object):
         self.rollbackButton.setFont(font)
         self.rollbackButton.setObjectName("rollbackButton")
         self.verticalLayout.addWidget(self.rollbackButton)
+        self.redoButton = QtWidgets.QPushButton(self.frame_5)
+        font = QtGui.QFont()
+        font.setPointSize(16)
+        self.redoButton.setFont(font)
+        self.redoButton.setObjectName("redoButton")
+        self.verticalLayout.addWidget(self.redoButton)
+        self.solveButton = QtWidgets.QPushButton(self.frame_5)
+        font = QtGui.QFont()
+        font.setPointSize(16)
+        self.solveButton.setFont(font)
+        self.solveButton.setObjectName("solveButton")
+        self.verticalLayout.addWidget(self.solveButton)
         spacerItem3 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
         self.verticalLayout.addItem(spacerItem3)
         self.quitButton = QtWidgets.QPushButton(self.frame_5)
@@ -1346,7 +318,7 @@ class Ui_sudokuMainWindow(object):
         self.gridLayout_14.addWidget(self.frame_5, 0, 1, 1, 1)
 
         self.retranslateUi(sudokuMainWindow)
-        self.quitButton.clicked.connect(sudokuMainWindow.close)
+        self.quitButton.clicked.connect(sudokuMainWindow.close) # type: ignore
         QtCore.QMetaObject.connectSlotsByName(sudokuMainWindow)
 
     def retranslateUi(self, sudokuMainWindow):
@@ -1359,6 +331,7 @@ class Ui_sudokuMainWindow(object):
         self.gameLevelComboBox.setItemText(2, _translate("sudokuMainWindow", "高级"))
         self.gameLevelComboBox.setItemText(3, _translate("sudokuMainWindow", "特级"))
         self.gameLevelComboBox.setItemText(4, _translate("sudokuMainWindow", "超级"))
+        self.label_2.setText(_translate("sudokuMainWindow", "存档："))
         self.numberButton2.setText(_translate("sudokuMainWindow", "2"))
         self.numberButton5.setText(_translate("sudokuMainWindow", "5"))
         self.numberButton6.setText(_translate("sudokuMainWindow", "6"))
@@ -1368,10 +341,14 @@ class Ui_sudokuMainWindow(object):
         self.numberButton8.setText(_translate("sudokuMainWindow", "8"))
         self.numberButton9.setText(_translate("sudokuMainWindow", "9"))
         self.numberButton1.setText(_translate("sudokuMainWindow", "1"))
+        self.notesButton.setText(_translate("sudokuMainWindow", "笔记"))
         self.newGameButton.setText(_translate("sudokuMainWindow", "新游戏"))
         self.restartButton.setText(_translate("sudokuMainWindow", "重新开始"))
         self.rollbackButton.setText(_translate("sudokuMainWindow", "回退"))
+        self.redoButton.setText(_translate("sudokuMainWindow", "重做"))
+        self.solveButton.setText(_translate("sudokuMainWindow", "求解"))
         self.quitButton.setText(_translate("sudokuMainWindow", "退出游戏"))
+from sudokuboard import SudokuBoard
 
 
 if __name__ == "__main__":